@@ -1,7 +1,8 @@
 from __future__ import absolute_import, unicode_literals
 
+import responses
 from transifex.api.jsonapi import JsonApi, Resource
-from transifex.api.jsonapi.auth import ULFAuthentication
+from transifex.api.jsonapi.auth import BearerAuthentication, ULFAuthentication
 
 from .constants import host
 
@@ -50,9 +51,33 @@ def test_setup_ulf():
     reset_setup()
 
 
+def test_auth_credentials_change():
+    auth = BearerAuthentication('key')
+    auth.token = "another_key"
+    assert auth() == {'Authorization': "Bearer another_key"}
+
+    auth = ULFAuthentication('public')
+    auth.secret = "secret"
+    assert auth() == {'Authorization': "ULF public:secret"}
+    auth.public = "another_public"
+    assert auth() == {'Authorization': "ULF another_public:secret"}
+
+
 def test_setup_any_callable():
     test_api.setup(host="http://some.host2",
                    auth=lambda: {'Authorization': "Another key2"})
     assert test_api.make_auth_headers() == {'Authorization': "Another key2"}
     assert test_api.host == "http://some.host2"
     reset_setup()
+
+
+@responses.activate
+def test_session_reuse():
+    responses.add(responses.GET, "{}/globaltests".format(host),
+                  json={'data': []})
+    session = test_api._session
+    test_api.request('get', "/globaltests")
+    test_api.close()
+    test_api.request('get', "/globaltests")
+    assert test_api._session is session
+    assert len(responses.calls) == 2
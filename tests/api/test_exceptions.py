@@ -92,3 +92,15 @@ def test_exception_grouping():
     except Exception:
         pass
     assert not caught
+
+
+def test_exception_without_code():
+    errors = [{"status": "400", "detail": "bad"}]
+
+    exc = JsonApiException(400, errors, None)
+    assert exc.filter(400) == errors
+    assert exc.exclude(400) == []
+
+    exc = JsonApiException.new(400, errors, None)
+    assert isinstance(exc, JsonApiException.get(400))
+    assert exc.filter("bad_request") == []
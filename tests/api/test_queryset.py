@@ -47,6 +47,24 @@ def test_collection():
     assert list(collection) == list(collection.all())
 
 
+def test_from_resources():
+    items = [test_api.Item(payload) for payload in payloads[1:4]]
+    collection = Collection.from_resources(test_api, items)
+
+    assert list(collection) == items
+    assert not collection.has_next()
+    assert not collection.has_previous()
+
+
+def test_extend():
+    items = [test_api.Item(payload) for payload in payloads[1:3]]
+    collection = Collection.from_resources(test_api, list(items))
+
+    collection.extend(collection)
+
+    assert list(collection) == items + items
+
+
 def test_from_data():
     collection = Collection.from_data(test_api, {'data': payloads[1:4]})
 
@@ -182,6 +200,24 @@ def test_include():
     assert item2.tag.name == "tag2"
 
 
+def test_include_with_plural_relationships():
+    collection = Collection.from_data(test_api, {
+        'data': [{'type': "items",
+                  'id': "1",
+                  'relationships': {
+                      'tags': {'data': [{'type': "tags", 'id': "1"}]},
+                  }}],
+        'included': [{'type': "tags",
+                      'id': "1",
+                      'attributes': {'name': "tag1"}}],
+    })
+
+    item, = collection
+    assert item.relationships['tags'] == {
+        'data': [{'type': "tags", 'id': "1"}],
+    }
+
+
 @responses.activate
 def test_limit():
     responses.add(
@@ -210,3 +246,57 @@ def test_limit():
         == list(test_api.Item.list().limit(2))
         == list(test_api.Item.list().limit(5).limit(2))
     )
+
+
+@responses.activate
+def test_all_streams_pages():
+    responses.add(responses.GET, "{}/items".format(host),
+                  json={'data': payloads[1:4],
+                        'links': {'next': "/items?page=2"}},
+                  match_querystring=True)
+    responses.add(responses.GET, "{}/items?page=2".format(host),
+                  json={'data': payloads[4:7]},
+                  match_querystring=True)
+
+    collection = test_api.Item.list()
+    items = collection.all()
+    assert next(items).id == "1"
+    assert len(responses.calls) == 1
+
+    assert [item.id for item in items] == ["2", "3", "4", "5", "6"]
+    assert len(responses.calls) == 2
+
+    # The first page was stored while it was being streamed
+    assert [item.id for item in collection] == ["1", "2", "3"]
+    assert len(responses.calls) == 2
+
+
+def test_url_parsing():
+    collection = Collection(test_api, '/items')
+    assert (collection._url, collection._params) == ('/items', {})
+
+    collection = Collection(test_api, '/items?page=2&sort=a&sort=b',
+                            {'limit': 10})
+    assert collection._url == '/items'
+    assert collection._params == {'page': "2", 'sort': ["a", "b"],
+                                  'limit': 10}
+
+    collection = Collection(test_api, '{}/items'.format(host))
+    assert (collection._url, collection._params) == ('/items', {})
+
+
+def test_to_dict():
+    collection = Collection.from_data(test_api,
+                                      {'data': payloads[1:3],
+                                       'links': {'next': "/items?page=2"}})
+    collection._url = "/items"
+    collection._params = {'filter[name]': "a b", 'sort': ["name", "id"]}
+
+    assert collection.to_dict() == {
+        'data': [item.to_dict() for item in collection],
+        'links': {
+            'self': "/items?filter%5Bname%5D=a+b&sort=name&sort=id",
+            'next': "/items?page=2",
+            'previous': None,
+        },
+    }
@@ -1,7 +1,7 @@
 from __future__ import absolute_import, unicode_literals
 
 import json
-from copy import deepcopy
+from copy import copy, deepcopy
 
 import responses
 from transifex.api.jsonapi import JsonApi, Resource
@@ -44,6 +44,11 @@ parent_payloads = Payloads(
 )
 
 
+def _state(resource):
+    return (resource.id, resource.attributes, resource.relationships,
+            resource.related, resource.links, resource.redirect)
+
+
 @responses.activate
 def test_initialization():
     responses.add(responses.GET, "{}/parents/1".format(host),
@@ -56,14 +61,43 @@ def test_initialization():
                 for parent in parents]
     assert all((children[i] == children[i + 1]
                 for i in range(len(children) - 1)))
-    assert all((children[i].__dict__ == children[i + 1].__dict__
+    assert all((_state(children[i]) == _state(children[i + 1])
                 for i in range(len(children) - 1)))
-    assert all((children[i].parent.__dict__ == children[i + 1].parent.__dict__
+    assert all((_state(children[i].parent) == _state(children[i + 1].parent)
                 for i in range(len(children) - 1)))
 
     child = test_api.Child(relationships={'parent': None})
     assert child.relationships == child.related == {'parent': None}
 
+    child = test_api.Child(parent={'data': {'type': "parents", 'id': "1"}})
+    assert child.attributes == {}
+    assert child.relationships == {
+        'parent': {'data': {'type': "parents", 'id': "1"}},
+    }
+    assert child.parent == test_api.Parent(id="1")
+
+
+def test_copy():
+    child = test_api.Child(
+        id="1", attributes={'name': "child 1"},
+        relationships={'parent': {'data': {'type': "parents", 'id': "1"}}},
+    )
+    child_copy = copy(child)
+    assert _state(child_copy) == _state(child)
+
+    child_copy.relationships['parent']['data']['id'] = "2"
+    assert child.relationships['parent']['data']['id'] == "1"
+
+
+def test_invalid_relationship():
+    for value in ("1", {'name': "parent"}, ["1", "2"]):
+        try:
+            test_api.Child(relationships={'parent': value})
+        except ValueError:
+            pass
+        else:
+            assert False, value
+
 
 @responses.activate
 def test_singular_fetch():
@@ -91,6 +125,70 @@ def test_singular_fetch():
     assert child.parent.name == "parent 1"
 
 
+@responses.activate
+def test_singular_fetch_many():
+    child_payload = deepcopy(child_payloads[1])
+    child_payload['relationships']['guardian'] = {
+        'data': {'type': "parents", 'id': "2"},
+    }
+    responses.add(responses.GET, "{}/children/1".format(host),
+                  json={'data': child_payload,
+                        'included': parent_payloads[1:3]})
+
+    child = test_api.Child(child_payload)
+    child.fetch('parent', 'guardian')
+
+    assert len(responses.calls) == 1
+    assert responses.calls[0].request.params == {'include': "parent,guardian"}
+    assert child.parent.attributes == {'name': "parent 1"}
+    assert child.guardian.attributes == {'name': "parent 2"}
+
+
+@responses.activate
+def test_singular_fetch_many_keeps_changes():
+    child_payload = deepcopy(child_payloads[1])
+    child_payload['relationships']['guardian'] = {
+        'data': {'type': "parents", 'id': "2"},
+    }
+    responses.add(responses.GET, "{}/children/1".format(host),
+                  json={'data': child_payload,
+                        'included': parent_payloads[1:3]})
+
+    child = test_api.Child(child_payload)
+    child.name = "new name"
+    child.fetch('parent', 'guardian')
+
+    assert len(responses.calls) == 1
+    assert child.name == "new name"
+    assert child.parent.attributes == {'name': "parent 1"}
+    assert child.guardian.attributes == {'name': "parent 2"}
+
+
+@responses.activate
+def test_singular_fetch_many_include_not_supported():
+    child_payload = deepcopy(child_payloads[1])
+    child_payload['relationships']['guardian'] = {
+        'data': {'type': "parents", 'id': "2"},
+    }
+    responses.add(responses.GET, "{}/children/1".format(host),
+                  status=400,
+                  json={'errors': [{'status': "400",
+                                    'code': "invalid_include",
+                                    'title': "Invalid include",
+                                    'detail': "Invalid include"}]})
+    responses.add(responses.GET, "{}/parents/1".format(host),
+                  json={'data': parent_payloads[1]})
+    responses.add(responses.GET, "{}/parents/2".format(host),
+                  json={'data': parent_payloads[2]})
+
+    child = test_api.Child(child_payload)
+    child.fetch('parent', 'guardian')
+
+    assert len(responses.calls) == 3
+    assert child.parent.attributes == {'name': "parent 1"}
+    assert child.guardian.attributes == {'name': "parent 2"}
+
+
 @responses.activate
 def test_fetch_plural():
     responses.add(responses.GET, "{}/parents/1/children".format(host),
@@ -145,6 +243,25 @@ def test_change_parent_with_save():
             "2")
 
 
+@responses.activate
+def test_change_parent_of_fetched_with_save():
+    responses.add(responses.GET, "{}/children/1".format(host),
+                  json={'data': child_payloads[1]})
+    responses.add(responses.PATCH, "{}/children/1".format(host),
+                  json={'data': child_payloads[1]})
+
+    child = test_api.Child.get("1")
+    child.parent = test_api.Parent(id="2")
+    child.save()
+
+    assert json.loads(responses.calls[1].request.body.decode()) == {
+        'data': {'type': "children", 'id': "1",
+                 'relationships': {
+                     'parent': {'data': {'type': "parents", 'id': "2"}},
+                 }},
+    }
+
+
 @responses.activate
 def test_change_parent_with_change():
     responses.add(responses.PATCH,
@@ -67,6 +67,28 @@ def test_as_resource():
             {'type': "foos", 'id': "1"})
 
 
+def test_as_resource_passthrough():
+    for value in (None, "1", {'id': "1"}, {'data': None},
+                  {'data': [{'type': "foos", 'id': "1"}]},
+                  {'links': {'related': "/foos/1"}}):
+        assert test_api.as_resource(value) is value
+
+
+def test_init_copies_payload():
+    attributes = {'hello': "world", 'tags': ["a", {'b': 1}]}
+    links = {'self': "/foos/1"}
+    foo = test_api.Foo(id="1", attributes=attributes, links=links)
+    attributes['tags'][1]['b'] = 2
+    links['self'] = "/foos/2"
+    assert foo.attributes == {'hello': "world", 'tags': ["a", {'b': 1}]}
+    assert foo.links == {'self': "/foos/1"}
+
+    attributes = {}
+    foo = test_api.Foo(id="1", attributes=attributes)
+    foo.attributes['hello'] = "world"
+    assert attributes == {}
+
+
 def test_setattr():
     foo = test_api.Foo(SIMPLE_PAYLOAD)
     foo.hello = "WORLD"
@@ -176,6 +198,71 @@ def test_save_existing():
     assert json.loads(call.request.body.decode()) == {'data': new_payload}
 
 
+@responses.activate
+def test_save_existing_sends_changes():
+    payload = {'type': "foos", 'id': "1",
+               'attributes': {'hello': "world", 'created': "then"}}
+    responses.add(responses.PATCH, "{}/foos/1".format(host),
+                  json={'data': payload})
+
+    foo = test_api.Foo(payload)
+    foo.save()
+    assert json.loads(responses.calls[0].request.body.decode()) == {
+        'data': payload,
+    }
+
+    foo.hello = "WORLD"
+    foo.save()
+    assert json.loads(responses.calls[1].request.body.decode()) == {
+        'data': {'type': "foos", 'id': "1", 'attributes': {'hello': "WORLD"}},
+    }
+
+
+@responses.activate
+def test_save_existing_sends_nested_changes():
+    payload = {'type': "foos", 'id': "1",
+               'attributes': {'hello': "world", 'settings': {'x': 1}}}
+    responses.add(responses.GET, "{}/foos/1".format(host),
+                  json={'data': payload})
+    responses.add(responses.PATCH, "{}/foos/1".format(host),
+                  json={'data': payload})
+
+    foo = test_api.Foo.get("1")
+    foo.settings['x'] = 2
+    foo.hello = "WORLD"
+    foo.save()
+    assert json.loads(responses.calls[1].request.body.decode()) == {
+        'data': {'type': "foos", 'id': "1",
+                 'attributes': {'hello': "WORLD", 'settings': {'x': 2}}},
+    }
+
+
+@responses.activate
+def test_save_existing_sends_deleted():
+    responses.add(responses.GET, "{}/foos/1".format(host),
+                  json={'data': SIMPLE_PAYLOAD})
+    responses.add(responses.PATCH, "{}/foos/1".format(host),
+                  json={'data': SIMPLE_PAYLOAD})
+
+    foo = test_api.Foo.get("1")
+    del foo.attributes['hello']
+    foo.save()
+    assert json.loads(responses.calls[1].request.body.decode()) == {
+        'data': {'type': "foos", 'id': "1", 'attributes': {'hello': None}},
+    }
+
+
+@responses.activate
+def test_save_existing_without_changes():
+    responses.add(responses.GET, "{}/foos/1".format(host),
+                  json={'data': SIMPLE_PAYLOAD})
+
+    foo = test_api.Foo.get("1")
+    foo.hello
+    foo.save()
+    assert len(responses.calls) == 1
+
+
 @responses.activate
 def test_save_new():
     new_payload = deepcopy(SIMPLE_PAYLOAD)
@@ -243,11 +330,23 @@ def test_eq():
     assert {'data': {'type': "foos", 'id': "1"}} == foo
     assert foo == test_api.Foo(id="1")
     assert test_api.Foo(id="1") == foo
+    assert test_api.Foo(id="2") != foo
+
+
+def test_repr():
+    assert repr(test_api.Foo(SIMPLE_PAYLOAD)) == "<Foo: 1>"
+    assert repr(test_api.Foo(id="1")) == "<Foo: 1 (Unfetched)>"
+    assert repr(test_api.Foo(hello="world")) == "<Foo: Unsaved>"
+    assert repr(Resource(id="1")) == "<Unknown Resource: 1 (Unfetched)>"
 
 
 def test_as_resource_identifier():
     foo = test_api.Foo(SIMPLE_PAYLOAD)
     assert foo.as_resource_identifier() == {'type': "foos", 'id': "1"}
+    foo.as_resource_identifier()['id'] = "2"
+    assert foo.as_resource_identifier() == {'type': "foos", 'id': "1"}
+    foo.id = "3"
+    assert foo.as_resource_identifier() == {'type': "foos", 'id': "3"}
 
 
 def test_as_relationship():
@@ -0,0 +1,119 @@
+from __future__ import absolute_import, unicode_literals
+
+import io
+
+import pytest
+import responses
+from transifex.api import Organization, TransifexApi, _TransifexResource
+from transifex.api.exceptions import DownloadException, UploadException
+
+from .constants import host
+
+ERRORS = [{"code": "parse_error", "detail": "Invalid file"}]
+
+
+def test_resources_are_registered():
+    assert Organization in TransifexApi.registry
+    api = TransifexApi()
+    assert issubclass(api.Organization, Organization)
+    assert issubclass(api.organizations, Organization)
+    assert api.Organization.API is api
+
+
+def test_bound_subclasses_are_not_registered():
+    registry = list(TransifexApi.registry)
+    TransifexApi()
+    assert TransifexApi.registry == registry
+
+
+def test_register_opt_out():
+    class Foo(_TransifexResource, register=False):
+        TYPE = "foos"
+
+    assert Foo not in TransifexApi.registry
+
+
+def test_user_subclasses_are_not_registered():
+    class MyOrganization(Organization):
+        pass
+
+    assert MyOrganization not in TransifexApi.registry
+    api = TransifexApi()
+    assert not issubclass(api.organizations, MyOrganization)
+
+
+def test_global_api_is_created_once():
+    import transifex.api
+
+    api = transifex.api.transifex_api
+    assert isinstance(api, TransifexApi)
+    assert transifex.api.transifex_api is api
+    from transifex.api import transifex_api
+
+    assert transifex_api is api
+
+
+@responses.activate
+def test_download_errors():
+    api = TransifexApi(auth="test_api_key")
+    responses.add(
+        responses.POST,
+        host + "/tmx_async_downloads",
+        json={
+            "data": {
+                "type": "tmx_async_downloads",
+                "id": "1",
+                "attributes": {"errors": ERRORS},
+            }
+        },
+    )
+
+    with pytest.raises(DownloadException) as exc_info:
+        api.TmxAsyncDownload.download()
+    assert str(exc_info.value) == "Invalid file"
+    assert exc_info.value.errors == ERRORS
+
+
+@responses.activate
+def test_upload_errors():
+    api = TransifexApi(auth="test_api_key")
+    responses.add(
+        responses.POST,
+        host + "/tmx_async_uploads",
+        json={
+            "data": {
+                "type": "tmx_async_uploads",
+                "id": "1",
+                "attributes": {"errors": ERRORS},
+            }
+        },
+    )
+
+    with pytest.raises(UploadException) as exc_info:
+        api.TmxAsyncUpload.upload("content")
+    assert str(exc_info.value) == "Invalid file"
+    assert exc_info.value.errors == ERRORS
+
+
+@responses.activate
+def test_download_to():
+    api = TransifexApi(auth="test_api_key")
+    responses.add(
+        responses.POST,
+        host + "/tmx_async_downloads",
+        status=202,
+        json={"data": {"type": "tmx_async_downloads", "id": "1"}},
+    )
+    responses.add(
+        responses.GET,
+        host + "/tmx_async_downloads/1",
+        status=303,
+        headers={"Location": "https://some.storage/file.tmx"},
+    )
+    responses.add(
+        responses.GET, "https://some.storage/file.tmx", body=b"<tmx></tmx>"
+    )
+
+    fp = io.BytesIO()
+    api.TmxAsyncDownload.download_to(fp, interval=0, chunk_size=4)
+    assert fp.getvalue() == b"<tmx></tmx>"
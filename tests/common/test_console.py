@@ -0,0 +1,21 @@
+from __future__ import unicode_literals
+
+from transifex.common.console import Color, pluralized
+
+
+def test_format():
+    assert Color.format('no tags') == 'no tags'
+    assert Color.format('[unknown]text') == '[unknown]text'
+    assert (Color.format('[high]bold[end] and [file]path[end]') ==
+            '\033[1mbold\033[0m and \033[36mpath\033[0m')
+    assert (Color.format('[high][cyan]text[end][end]') ==
+            '\033[1;36mtext\033[0m')
+    assert (Color.format('[warn][opt][prompt][error][pink][cyan][green]'
+                         '[red][yel]') ==
+            '\033[91;33;31;91;36;32;31;33m')
+
+
+def test_pluralized():
+    assert pluralized('1 file', '{cnt} files', 1) == '1 file'
+    assert pluralized('1 file', '{cnt} files', 3) == '3 files'
+    assert pluralized('one [other]', 'many', 1) == 'one [other]'
@@ -0,0 +1,10 @@
+from transifex.common.utils import generate_hashed_key
+
+
+def test_generate_hashed_key():
+    # Keys identify strings on the server and must never change
+    assert (generate_hashed_key('hello') ==
+            '81d25fcd2bf89b8d0873be693842e7d5')
+    assert (generate_hashed_key('{cnt, plural, one {a:b} other {c}}',
+                                'x,y') ==
+            '88caab752a4d10b9aaa2b27e7e77b4e9')
@@ -0,0 +1,10 @@
+from transifex.common.utils import make_hashable
+
+
+def test_make_hashable():
+    assert make_hashable('a') == 'a'
+    assert make_hashable(['b', 'a']) == make_hashable(('a', 'b'))
+    assert (make_hashable({'b': [2, 1], 'a': 'x'}) ==
+            make_hashable({'a': 'x', 'b': [1, 2]}))
+    hash(make_hashable({'tags': [{'b': 1}, {'a': 2}]}))
+    assert make_hashable([1, 'a', None]) == make_hashable(['a', None, 1])
@@ -1,10 +1,17 @@
 from __future__ import unicode_literals
 
 import sys
+from copy import copy
 
 import pytest
 
-from transifex.common.strings import LazyString, alt_quote, printf_to_format_style
+from transifex.common.strings import (
+    CachedLazyString,
+    LazyString,
+    alt_quote,
+    batch_printf_to_format_style,
+    printf_to_format_style,
+)
 
 
 def test_printf_to_format_style():
@@ -20,6 +27,20 @@ def test_printf_to_format_style():
     assert string == "This is {variable_1} and {bar} and {variable_2}"
     assert set(variables) == {"variable_1", "bar", "variable_2"}
 
+    assert printf_to_format_style("No placeholders") == ("No placeholders", [])
+    assert printf_to_format_style("100% sure") == ("100% sure", [])
+
+
+def test_batch_printf_to_format_style():
+    assert batch_printf_to_format_style(
+        ["No placeholders", "This is %s & %(foo)s", "100% sure"]
+    ) == [
+        ("No placeholders", []),
+        ("This is {variable_1} & {foo}", ["variable_1", "foo"]),
+        ("100% sure", []),
+    ]
+    assert batch_printf_to_format_style([]) == []
+
 
 def test_alt_quote():
     assert alt_quote('"', r"This is a string") == '"'
@@ -316,3 +337,39 @@ class TestLazyString:
 
     def test_zfill(self):
         assert LazyString(str.upper, "hello world").zfill(20) == "000000000HELLO WORLD"
+
+    def test_copy(self):
+        string = copy(LazyString(str.upper, "hello world"))
+        assert string == "HELLO WORLD"
+        assert not hasattr(string, "__dict__")
+
+
+def test_cached_lazy_string():
+    calls = []
+
+    def func(value):
+        calls.append(value)
+        return value.upper()
+
+    string = CachedLazyString(func, "hello")
+    assert calls == []
+    assert string == "HELLO"
+    assert string + " world" == "HELLO world"
+    assert len(string) == 5
+    assert calls == ["hello"]
+
+    string.invalidate()
+    assert str(string) == "HELLO"
+    assert calls == ["hello", "hello"]
+
+
+def test_cached_lazy_string_hash():
+    values = ["hello"]
+    string = CachedLazyString(lambda: values[-1])
+    assert hash(string) == hash("hello")
+    assert {string: 1}["hello"] == 1
+
+    values.append("world")
+    assert hash(string) == hash("hello")
+    string.invalidate()
+    assert hash(string) == hash("world")
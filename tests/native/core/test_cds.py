@@ -3,7 +3,7 @@ from operator import itemgetter
 import pytest
 import responses
 from mock import patch
-from transifex.native.cds import CDSHandler
+from transifex.native.cds import MAX_FETCH_WORKERS, CDSHandler
 from transifex.native.parsing import SourceString
 
 
@@ -281,6 +281,36 @@ class TestCDSHandler(object):
         )
         assert resp == {'el': (False, {})}
 
+    @responses.activate
+    def test_fetch_translations_parallel(self):
+        cds_host = 'https://some.host'
+        # More languages than workers, so that workers fetch several each
+        codes = ['lang{}'.format(i) for i in range(MAX_FETCH_WORKERS * 2 + 1)]
+        cds_handler = CDSHandler(codes, 'some_token', host=cds_host)
+
+        responses.add(
+            responses.GET, cds_host + '/languages',
+            json={'data': [{'code': code} for code in codes]}, status=200
+        )
+        for code in codes:
+            responses.add(
+                responses.GET, cds_host + '/content/' + code,
+                json={'data': {'key1': {'string': 'key1_' + code}}},
+                status=200
+            )
+
+        resp = cds_handler.fetch_translations()
+        assert resp == {
+            code: (True, {'key1': {'string': 'key1_' + code}})
+            for code in codes
+        }
+
+    def test_session_pool_size(self):
+        cds_handler = CDSHandler(['el'], 'some_token')
+        adapter = cds_handler._session.get_adapter('https://some.host')
+        # One pooled connection per fetch worker
+        assert adapter._pool_maxsize == MAX_FETCH_WORKERS
+
     @responses.activate
     @patch('transifex.native.cds.logger')
     def test_fetch_translations_filter_tags(self, patched_logger):
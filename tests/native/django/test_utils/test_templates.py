@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 import pytest
 from django.template import TemplateSyntaxError
+from django.template.base import Parser
+from mock import patch
 from transifex.native.django.utils.templates import \
     extract_transifex_template_strings
 from transifex.native.parsing import SourceString
@@ -93,3 +95,33 @@ class TestTemplates(object):
         )
         with pytest.raises(TemplateSyntaxError):
             extract_transifex_template_strings(src)
+
+    def test_parsing_is_cached(self):
+        src = TEMPLATE.replace(
+            u'{{string1}}',
+            u'{% t "A very important sentence" %}'
+        )
+        with patch('transifex.native.django.utils.templates.Parser',
+                   wraps=Parser) as parser:
+            first = extract_transifex_template_strings(src, origin='a.html')
+            second = extract_transifex_template_strings(src, origin='b.html')
+        assert parser.call_count <= 1
+        assert first[0].string == second[0].string
+        assert first[0] is not second[0]
+        assert first[0].occurrences == ['a.html:5']
+        assert second[0].occurrences == ['b.html:5']
+
+    def test_syntax_error_origin(self):
+        src = TEMPLATE.replace(u'{{string1}}', u'{% t %}{% endut %}')
+        with patch('transifex.native.django.utils.templates.Parser',
+                   wraps=Parser) as parser:
+            with pytest.raises(TemplateSyntaxError):
+                extract_transifex_template_strings(src, origin='a.html')
+        assert parser.call_args[0][3] == 'a.html'
+
+    def test_no_t_tags(self):
+        src = TEMPLATE.replace(
+            u'{{string1}}',
+            u'{% trans "Not a Transifex Native string" %}'
+        )
+        assert extract_transifex_template_strings(src) == []
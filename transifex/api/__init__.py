@@ -1,5 +1,7 @@
+import sys
 import time
 
+import requests
 import transifex
 
 from .exceptions import DownloadException, UploadException
@@ -7,6 +9,18 @@ from .jsonapi import JsonApi
 from .jsonapi import Resource as JsonApiResource
 
 
+def _raise_for_errors(job, exception_class):
+    """Raise `exception_class` if the async download/upload `job` has failed."""
+
+    errors = job.attributes.get("errors")
+    if errors:
+        # The way Transifex APIv3 works right now, only one error will be
+        # returned, so we give priority to the first error's 'detail' field. If
+        # more errors are included in the future, the user can inspect the
+        # exception's second argument
+        raise exception_class(errors[0]["detail"], errors)
+
+
 class DownloadMixin(object):
     """Mixin that offers a download method for Transifex APIv3."""
 
@@ -18,17 +32,26 @@ class DownloadMixin(object):
 
         download = cls.create(*args, **kwargs)
         while True:
-            if hasattr(download, "errors") and len(download.errors) > 0:
-                # The way Transifex APIv3 works right now, only one error will be
-                # returned, so we give priority to the first error's 'detail' field. If
-                # more errors are included in the future, the user can inspect the
-                # exception's second argument
-                raise DownloadException(download.error[0]["detail"], download.errors)
+            _raise_for_errors(download, DownloadException)
             if download.redirect:
                 return download.redirect
             time.sleep(interval)
             download.reload()
 
+    @classmethod
+    def download_to(cls, fp, interval=5, chunk_size=64 * 1024, *args, **kwargs):
+        """Create and poll an async download, like `download`, and then write
+        the downloaded content to the binary file-like object `fp`. The content
+        is streamed in chunks of `chunk_size` bytes, so it is never held in
+        memory as a whole.
+        """
+
+        url = cls.download(interval, *args, **kwargs)
+        with requests.get(url, stream=True) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size):
+                fp.write(chunk)
+
 
 class UploadMixin(object):
     @classmethod
@@ -41,26 +64,17 @@ class UploadMixin(object):
                          of the upload job
         :param data: Data that will be sent as (non file) form fields
         """
-        for key, value in list(data.items()):
+        for key, value in data.items():
             if isinstance(value, JsonApiResource):
                 data[key] = value.id
 
         upload = cls.create_with_form(data=data, files={"content": content})
 
         while True:
-            if hasattr(upload, "errors") and len(upload.errors) > 0:
-                # The way Transifex APIv3 works right now, only one error will be
-                # returned, so we give priority to the first error's 'detail' field. If
-                # more errors are included in the future, the user can inspect the
-                # exception's second argument
-                raise UploadException(upload.errors[0]["detail"], upload.errors)
-
+            _raise_for_errors(upload, UploadException)
             if upload.redirect:
                 return upload.follow()
-            elif (
-                hasattr(upload, "attributes")
-                and upload.attributes.get("status") == "succeeded"
-            ):
+            elif upload.attributes.get("status") == "succeeded":
                 return upload.attributes.get("details")
 
             time.sleep(interval)
@@ -129,28 +143,87 @@ class TransifexApi(JsonApi):
     tmx_async_uploads: JsonApiResource
 
 
-@TransifexApi.register
-class Organization(JsonApiResource):
-    TYPE = "organizations"
-
-
-@TransifexApi.register
-class Team(JsonApiResource):
-    TYPE = "teams"
-
-
-@TransifexApi.register
-class Project(JsonApiResource):
-    TYPE = "projects"
-
-
-@TransifexApi.register
-class Language(JsonApiResource):
-    TYPE = "languages"
-
-
-@TransifexApi.register
-class Resource(JsonApiResource):
+class _TransifexResource(JsonApiResource):
+    """Base class for Transifex APIv3 resource types. Subclasses defined in
+    this module are automatically registered with `TransifexApi`, instead of
+    having to use the `@TransifexApi.register` decorator. Subclasses defined
+    elsewhere (eg `class MyProject(transifex.api.Project)`) are not, so that
+    they don't replace the built-in types by accident; pass `register=True` to
+    register them anyway:
+
+        >>> class Foo(_TransifexResource, register=True):
+        ...     TYPE = "foos"
+    """
+
+    def __init_subclass__(cls, register=None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if register is None:
+            register = cls.__module__ == __name__
+        # Subclasses created by `JsonApi.__init__` to bind resource types to an
+        # API connection instance already belong to the registry
+        if register and "API" not in cls.__dict__:
+            TransifexApi.registry.append(cls)
+
+
+def _make(name, type_, *mixins):
+    return type(
+        name, (_TransifexResource,) + mixins, {"__module__": __name__, "TYPE": type_}
+    )
+
+
+# Resource types that only need their API type are generated with `_make`;
+# the ones that need more than that are defined explicitly below
+Organization = _make("Organization", "organizations")
+Team = _make("Team", "teams")
+Project = _make("Project", "projects")
+Language = _make("Language", "languages")
+ResourceString = _make("ResourceString", "resource_strings")
+ResourceStringsAsyncUpload = _make(
+    "ResourceStringsAsyncUpload", "resource_strings_async_uploads", UploadMixin
+)
+User = _make("User", "users")
+TeamMembership = _make("TeamMembership", "team_memberships")
+ResourceLanguageStats = _make("ResourceLanguageStats", "resource_language_stats")
+ResourceStringsAsyncDownload = _make(
+    "ResourceStringsAsyncDownload", "resource_strings_async_downloads", DownloadMixin
+)
+ResourceTranslationsAsyncDownload = _make(
+    "ResourceTranslationsAsyncDownload",
+    "resource_translations_async_downloads",
+    DownloadMixin,
+)
+I18nFormat = _make("I18nFormat", "i18n_formats")
+ResourceStringsRevision = _make("ResourceStringsRevision", "resource_strings_revisions")
+ContextScreenshotMap = _make("ContextScreenshotMap", "context_screenshot_maps")
+ContextScreenshot = _make("ContextScreenshot", "context_screenshots")
+OrganizationActivityReportsAsyncDownload = _make(
+    "OrganizationActivityReportsAsyncDownload",
+    "organization_activity_reports_async_downloads",
+    DownloadMixin,
+)
+ProjectActivityReportsAsyncDownload = _make(
+    "ProjectActivityReportsAsyncDownload",
+    "project_activity_reports_async_downloads",
+    DownloadMixin,
+)
+ResourceActivityReportsAsyncDownload = _make(
+    "ResourceActivityReportsAsyncDownload",
+    "resource_activity_reports_async_downloads",
+    DownloadMixin,
+)
+ProjectWebhook = _make("ProjectWebhook", "project_webhooks")
+ResourceStringComment = _make("ResourceStringComment", "resource_string_comments")
+TeamActivityReportsAsyncDownload = _make(
+    "TeamActivityReportsAsyncDownload",
+    "team_activity_reports_async_downloads",
+    DownloadMixin,
+)
+TmxAsyncDownload = _make("TmxAsyncDownload", "tmx_async_downloads", DownloadMixin)
+TmxAsyncUpload = _make("TmxAsyncUpload", "tmx_async_uploads", UploadMixin)
+UniqueIdentifier = _make("UniqueIdentifier", "unique_identifiers", UploadMixin)
+
+
+class Resource(_TransifexResource):
     TYPE = "resources"
 
     def purge(self):
@@ -163,24 +236,12 @@ class Resource(JsonApiResource):
         return count
 
 
-@TransifexApi.register
-class ResourceString(JsonApiResource):
-    TYPE = "resource_strings"
-
-
-@TransifexApi.register
-class ResourceTranslation(JsonApiResource):
+class ResourceTranslation(_TransifexResource):
     TYPE = "resource_translations"
     EDITABLE = ["strings", "reviewed", "proofread"]
 
 
-@TransifexApi.register
-class ResourceStringsAsyncUpload(JsonApiResource, UploadMixin):
-    TYPE = "resource_strings_async_uploads"
-
-
-@TransifexApi.register
-class ResourceTranslationsAsyncUpload(JsonApiResource, UploadMixin):
+class ResourceTranslationsAsyncUpload(_TransifexResource, UploadMixin):
     TYPE = "resource_translations_async_uploads"
 
     @classmethod
@@ -189,95 +250,15 @@ class ResourceTranslationsAsyncUpload(JsonApiResource, UploadMixin):
         return super().upload(content, interval, **data)
 
 
-@TransifexApi.register
-class User(JsonApiResource):
-    TYPE = "users"
-
-
-@TransifexApi.register
-class TeamMembership(JsonApiResource):
-    TYPE = "team_memberships"
-
-
-@TransifexApi.register
-class ResourceLanguageStats(JsonApiResource):
-    TYPE = "resource_language_stats"
-
-
-@TransifexApi.register
-class ResourceStringsAsyncDownload(JsonApiResource, DownloadMixin):
-    TYPE = "resource_strings_async_downloads"
-
-
-@TransifexApi.register
-class ResourceTranslationsAsyncDownload(JsonApiResource, DownloadMixin):
-    TYPE = "resource_translations_async_downloads"
-
-
-@TransifexApi.register
-class I18nFormat(JsonApiResource):
-    TYPE = "i18n_formats"
-
-
-@TransifexApi.register
-class ResourceStringsRevision(JsonApiResource):
-    TYPE = "resource_strings_revisions"
-
-
-@TransifexApi.register
-class ContextScreenshotMap(JsonApiResource):
-    TYPE = "context_screenshot_maps"
-
-
-@TransifexApi.register
-class ContextScreenshot(JsonApiResource):
-    TYPE = "context_screenshots"
-
-
-@TransifexApi.register
-class OrganizationActivityReportsAsyncDownload(JsonApiResource, DownloadMixin):
-    TYPE = "organization_activity_reports_async_downloads"
-
-
-@TransifexApi.register
-class ProjectActivityReportsAsyncDownload(JsonApiResource, DownloadMixin):
-    TYPE = "project_activity_reports_async_downloads"
-
-
-@TransifexApi.register
-class ResourceActivityReportsAsyncDownload(JsonApiResource, DownloadMixin):
-    TYPE = "resource_activity_reports_async_downloads"
-
-
-@TransifexApi.register
-class ProjectWebhook(JsonApiResource):
-    TYPE = "project_webhooks"
-
-
-@TransifexApi.register
-class ResourceStringComment(JsonApiResource):
-    TYPE = "resource_string_comments"
-
-
-@TransifexApi.register
-class TeamActivityReportsAsyncDownload(JsonApiResource, DownloadMixin):
-    TYPE = "team_activity_reports_async_downloads"
-
-
-@TransifexApi.register
-class TmxAsyncDownload(JsonApiResource, DownloadMixin):
-    TYPE = "tmx_async_downloads"
-
-
-@TransifexApi.register
-class TmxAsyncUpload(JsonApiResource, UploadMixin):
-    TYPE = "tmx_async_uploads"
-
-
-@TransifexApi.register
-class UniqueIdentifier(JsonApiResource, UploadMixin):
-    TYPE = "unique_identifiers"
-
+# This is our global object. It is created on first access (PEP 562) so that
+# importing `transifex.api` doesn't pay for binding every resource type to an
+# API connection instance up front
+if sys.version_info < (3, 7):  # pragma: no cover
+    transifex_api = TransifexApi()
+else:
 
-# This is our global object
-transifex_api = TransifexApi()
+    def __getattr__(name):
+        if name == "transifex_api":
+            globals()["transifex_api"] = TransifexApi()
+            return globals()["transifex_api"]
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
@@ -1,17 +1,18 @@
 from __future__ import absolute_import, unicode_literals
 
-from copy import deepcopy
-
 import requests
-import six
 
 from .auth import BearerAuthentication
-from .compat import JSONDecodeError
+from .compat import JSONDecodeError, response_json
 from .exceptions import JsonApiException
 from .resources import Resource
+from .utils import is_dict
 
 type_ = type  # alias to avoid naming conflicts
 
+_CONTENT_TYPE = "application/vnd.api+json"
+_BULK_CONTENT_TYPE = 'application/vnd.api+json;profile="bulk"'
+
 
 class _JsonApiMetaclass(type_):
     """Simple metaclass that overwrites the `registry` class variable on
@@ -60,7 +61,7 @@ class _JsonApiMetaclass(type_):
         return result
 
 
-class JsonApi(six.with_metaclass(_JsonApiMetaclass, object)):
+class JsonApi(metaclass=_JsonApiMetaclass):
     """Inteface for a new {json:api} API connection. Initialization
     parameters:
 
@@ -119,7 +120,10 @@ class JsonApi(six.with_metaclass(_JsonApiMetaclass, object)):
         if self.HEADERS is None:
             self.headers = {}
         else:
-            self.headers = deepcopy(self.HEADERS)
+            # Headers are a flat str-to-str mapping, a shallow copy is enough
+            self.headers = dict(self.HEADERS)
+        # Reuse connections (keep-alive) across requests to the same host
+        self._session = requests.Session()
         self.setup(**kwargs)
 
     def setup(self, host=None, auth=None, headers=None):
@@ -135,6 +139,13 @@ class JsonApi(six.with_metaclass(_JsonApiMetaclass, object)):
         if headers is not None:
             self.headers.update(headers)
 
+    def close(self):
+        """Close the connections kept open for reuse. The API connection can
+        still be used afterwards, new connections will be opened as needed.
+        """
+
+        self._session.close()
+
     @classmethod
     def register(cls, klass):
         """Register a API resource type with this API connection *type* (since
@@ -162,26 +173,27 @@ class JsonApi(six.with_metaclass(_JsonApiMetaclass, object)):
         **kwargs
     ):
         if url.startswith("/"):
-            url = "{}{}".format(self.host, url)
+            url = self.host + url
 
         if bulk:
-            content_type = 'application/vnd.api+json;profile="bulk"'
-        elif (data, files) == (None, None):
-            content_type = "application/vnd.api+json"
+            content_type = _BULK_CONTENT_TYPE
+        elif data is None and files is None:
+            content_type = _CONTENT_TYPE
         else:
             # If data and/or files are set, requests will determine
             # Content-Type on its own
             content_type = None
 
-        actual_headers = dict(self.headers)
-
-        if headers is not None:
-            actual_headers.update(headers)
-        actual_headers.update(self.make_auth_headers())
+        # Build the request's headers in one go, without touching the
+        # connection's or the caller's dicts
+        if headers is None:
+            actual_headers = {**self.headers, **self.make_auth_headers()}
+        else:
+            actual_headers = {**self.headers, **headers, **self.make_auth_headers()}
         if content_type is not None:
             actual_headers.setdefault("Content-Type", content_type)
 
-        response = requests.request(
+        response = self._session.request(
             method,
             url,
             headers=actual_headers,
@@ -194,14 +206,14 @@ class JsonApi(six.with_metaclass(_JsonApiMetaclass, object)):
         if not response.ok:
             try:
                 exc = JsonApiException.new(
-                    response.status_code, response.json()["errors"], response
+                    response.status_code, response_json(response)["errors"], response
                 )
             except Exception:
                 response.raise_for_status()
             else:
                 raise exc
         try:
-            return response.json()
+            return response_json(response)
         except JSONDecodeError:
             # Most likely empty response when deleting
             return response
@@ -241,6 +253,16 @@ class JsonApi(six.with_metaclass(_JsonApiMetaclass, object)):
         use the appropriate Resource subclass.
         """
 
+        # Only something that looks like a resource object (or a response or
+        # relationship wrapping one) can be turned into a Resource; let
+        # everything else (Resource instances, IDs, None, plural
+        # relationships) through without going through `new`
+        body = data
+        if is_dict(body) and "data" in body:
+            body = body["data"]
+        if not is_dict(body) or body.get("type") is None:
+            return data
+
         try:
             return self.new(data)
         except Exception:
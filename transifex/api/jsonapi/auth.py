@@ -2,13 +2,34 @@ from __future__ import absolute_import, unicode_literals
 
 import datetime
 
+# `jwt` is an optional requirement, so it is imported on first use by
+# `JWTAuthentication` instead of at the top level
+_jwt = None
+
+
+def _utc_now():
+    # Timezone-aware, unlike the deprecated `datetime.utcnow()`
+    return datetime.datetime.now(datetime.timezone.utc)
+
 
 class SimpleAuthentication:
+    __slots__ = ("_token", "_headers")
+
     def __init__(self, token):
         self.token = token
 
+    @property
+    def token(self):
+        return self._token
+
+    @token.setter
+    def token(self, token):
+        self._token = token
+        # Build the header when the token changes instead of on every request
+        self._headers = {"Authorization": f"{self.KEY} {token}"}
+
     def __call__(self):
-        return {"Authorization": f"{self.KEY} {self.token}"}
+        return self._headers
 
 
 class BearerAuthentication(SimpleAuthentication):
@@ -26,6 +47,8 @@ class BearerAuthentication(SimpleAuthentication):
     This has the exact same effect, but is more verbose.
     """
 
+    __slots__ = ()
+
     KEY = "Bearer"
 
 
@@ -37,19 +60,48 @@ class OAuthAuthentication(SimpleAuthentication):
         >>> transifex_api.setup(OAuthAuthentication("Token"))
     """
 
+    __slots__ = ()
+
     KEY = "OAuth"
 
 
 class ULFAuthentication(object):
+    __slots__ = ("_public", "_secret", "_headers")
+
     def __init__(self, public, secret=None):
-        self.public = public
-        self.secret = secret
+        self._public = public
+        self._secret = secret
+        self._build_headers()
+
+    @property
+    def public(self):
+        return self._public
+
+    @public.setter
+    def public(self, public):
+        self._public = public
+        self._build_headers()
+
+    @property
+    def secret(self):
+        return self._secret
+
+    @secret.setter
+    def secret(self, secret):
+        self._secret = secret
+        self._build_headers()
+
+    def _build_headers(self):
+        # Built when the credentials change instead of on every request
+        if self._secret is None:
+            self._headers = {"Authorization": "ULF {}".format(self._public)}
+        else:
+            self._headers = {
+                "Authorization": ("ULF {}:{}".format(self._public, self._secret))
+            }
 
     def __call__(self):
-        if self.secret is None:
-            return {"Authorization": "ULF {}".format(self.public)}
-        else:
-            return {"Authorization": ("ULF {}:{}".format(self.public, self.secret))}
+        return self._headers
 
 
 class JWTAuthentication(object):
@@ -63,6 +115,8 @@ class JWTAuthentication(object):
         ...                              duration=300))
     """
 
+    __slots__ = ("payload", "secret", "duration", "algorithm", "get_now")
+
     def __init__(self, payload, secret, duration, algorithm="HS256", get_now=None):
         self.payload = dict(payload)
         self.secret = secret
@@ -72,16 +126,16 @@ class JWTAuthentication(object):
         # Dependency injection for getting the current timestamp; maybe it will
         # make testing easier
         if get_now is None:
-            get_now = datetime.datetime.utcnow
+            get_now = _utc_now
         self.get_now = get_now
 
     def __call__(self):
-        import jwt  # Optional requirement, don't require at top level
+        global _jwt
+        if _jwt is None:
+            import jwt as _jwt
 
         exp = self.get_now() + datetime.timedelta(seconds=self.duration)
-        payload = dict(self.payload)
-        payload["exp"] = exp
-        token = jwt.encode(
-            payload=payload, secret=self.secret, algorithm=self.algorithm
-        )
-        return {"Authorization": "JWT {}".format(token)}
+        # A new dict every time, `self.payload` is never modified
+        payload = {**self.payload, "exp": exp}
+        token = _jwt.encode(payload=payload, key=self.secret, algorithm=self.algorithm)
+        return {"Authorization": f"JWT {token}"}
@@ -1,26 +1,81 @@
 from __future__ import absolute_import, unicode_literals
 
-from .compat import abc, parse_qs, urlparse
+from functools import lru_cache
+
+from .compat import abc, parse_qs, urlencode, urlparse
 from .exceptions import DoesNotExist, MultipleObjectsReturned
+from .utils import is_dict
+
+# `.resources` imports this module, so `Resource` is imported on first use by
+# `Collection.filter` instead of at the top level
+_Resource = None
+
+
+@lru_cache(maxsize=1024)
+def _parse_url(url):
+    """Split `url` into its path and its query parameters. Cached, because
+    chained and paginated collections are created from the same URLs over and
+    over. The parameter values are tuples so that the cached result can't be
+    mutated.
+    """
+
+    parsed = urlparse(url)
+    query_params = parse_qs(parsed.query)
+    return (
+        parsed.path,
+        tuple((key, tuple(value)) for key, value in query_params.items()),
+    )
+
+
+@lru_cache(maxsize=512)
+def _filter_key(key):
+    """Translate a `filter` keyword to a query parameter, eg
+    `project__slug` => `filter[project][slug]`.
+    """
+
+    return "filter" + "".join(("[{}]".format(part) for part in key.split("__")))
+
+
+@lru_cache(maxsize=32)
+def _page_key(key):
+    """Translate a `page` keyword to a query parameter, eg `size` =>
+    `page[size]`.
+    """
+
+    return "page[{}]".format(key)
+
+
+def _is_bare_path(url):
+    """Whether `url` is a plain path (eg `/projects`) that `urlparse` would
+    return unchanged. This is the common case for collections built by
+    `filter`, `page` etc, which reuse the path of the original collection.
+    """
+
+    return (
+        url.startswith("/")
+        and not url.startswith("//")
+        and "?" not in url
+        and ";" not in url
+        and "#" not in url
+    )
 
 
 class Collection(abc.MutableSequence):
+    __slots__ = ("API", "_url", "_params", "_data", "_next_url", "_previous_url")
+
     def __init__(self, API, url, params=None):
         if params is None:
             params = {}
         else:
             params = dict(params)
 
-        parsed = urlparse(url)
-        path, query = parsed.path, parsed.query
-        query_params = parse_qs(query)
-        query_params = {
-            key: value[0] if len(value) == 1 else value
-            for key, value in list(query_params.items())
-        }
-
-        url = path
-        params.update(query_params)
+        if not _is_bare_path(url):
+            url, query_params = _parse_url(url)
+            if query_params:
+                params.update(
+                    (key, value[0] if len(value) == 1 else list(value))
+                    for key, value in query_params
+                )
 
         self.API = API
         self._url = url
@@ -36,6 +91,16 @@ class Collection(abc.MutableSequence):
         result._evaluate(response_body)
         return result
 
+    @classmethod
+    def from_resources(cls, API, resources):
+        """Make an evaluated, single-page collection out of a list of
+        Resource instances. The list is used as is, not copied.
+        """
+
+        result = cls(API, "")
+        result._data = resources
+        return result
+
     # Evaluate
     @property
     def data(self):
@@ -56,29 +121,65 @@ class Collection(abc.MutableSequence):
         if self._data is not None:
             return
 
+        data, included = self._fetch(response_body)
+        self._data = [self._build_item(item, included) for item in data]
+
+    def _iter_data(self):
+        """Iterate over the items of the collection. If the collection hasn't
+        been evaluated yet, items are yielded as soon as each one is built
+        from the response, before the rest of the page is processed.
+        """
+
+        if self._data is not None:
+            yield from self._data
+            return
+
+        data = []
+        for item in self._build_data():
+            data.append(item)
+            yield item
+        self._data = data
+
+    def _fetch(self, response_body=None):
+        """Fetch the page, unless `response_body` is supplied, and set the
+        pagination links. Returns the raw items and an index of the included
+        resources by `(type, id)`.
+        """
+
         if response_body is None:
             response_body = self.API.request("get", self._url, params=self._params)
-        included = {}
-        if "included" in response_body:
-            included = {
-                (item["type"], item["id"]): item for item in response_body["included"]
-            }
-
-        self._data = []
-        for item in response_body["data"]:
+        links = response_body.get("links", {})
+        self._next_url = links.get("next")
+        self._previous_url = links.get("previous")
+
+        included = response_body.get("included")
+        if included:
+            included = {(item["type"], item["id"]): item for item in included}
+        return response_body["data"], included
+
+    def _build_data(self, response_body=None):
+        """Fetch the page, unless `response_body` is supplied, and yield its
+        items as Resource instances. Sets the pagination links.
+        """
+
+        data, included = self._fetch(response_body)
+        for item in data:
+            yield self._build_item(item, included)
+
+    def _build_item(self, item, included):
+        api_new = self.API.new
+        relationships = item.pop("relationships", None) or {}
+        if included:
+            # Replace singular relationships with the included resources
             related = {}
-            for (name, relationship) in item.get("relationships", {}).items():
-                if relationship is None or "data" not in relationship:
+            for (name, relationship) in relationships.items():
+                if relationship is None or not is_dict(relationship.get("data")):
                     continue
                 key = (relationship["data"]["type"], relationship["data"]["id"])
                 if key in included:
-                    related[name] = self.API.new(included[key])
-            relationships = item.pop("relationships", {})
+                    related[name] = api_new(included[key])
             relationships.update(related)
-            self._data.append(self.API.new(relationships=relationships, **item))
-
-        self._next_url = response_body.get("links", {}).get("next")
-        self._previous_url = response_body.get("links", {}).get("previous")
+        return api_new(relationships=relationships, **item)
 
     # Make it look like a list
     def __getitem__(self, index):
@@ -96,40 +197,63 @@ class Collection(abc.MutableSequence):
     def insert(self, index, value):
         self.data.insert(index, value)
 
+    # `abc.MutableSequence` implements these on top of `__getitem__`/`insert`
+    # one item at a time; delegate the common ones to the underlying list
+    def __iter__(self):
+        return iter(self.data)
+
+    def __reversed__(self):
+        return reversed(self.data)
+
+    def __contains__(self, value):
+        return value in self.data
+
+    def index(self, *args):
+        return self.data.index(*args)
+
+    def count(self, value):
+        return self.data.count(value)
+
+    def append(self, value):
+        self.data.append(value)
+
+    def extend(self, values):
+        # Iterating a collection while it grows would never end
+        self.data.extend(list(values) if values is self else values)
+
     def __repr__(self):
         return repr(self.data)
 
     def to_dict(self):
         self_url = self._url
         if self._params:
-            self_url += "?" + "&".join(
-                ("{}={}".format(key, value) for key, value in self._params.items())
-            )
+            self_url += "?" + urlencode(self._params, doseq=True)
 
-        links = {"self": self_url}
-        if self.has_next():
-            links["next"] = self.next_url()
-        else:
-            links["next"] = None
-        if self.has_previous():
-            links["previous"] = self.previous_url()
-        else:
-            links["previous"] = None
+        self._evaluate()
+        links = {
+            "self": self_url,
+            "next": self._next_url or None,
+            "previous": self._previous_url or None,
+        }
 
-        return {"data": [item.to_dict() for item in self.data], "links": links}
+        return {"data": [item.to_dict() for item in self._data], "links": links}
 
     # Pagination
     def has_next(self):
-        return bool(self.next_url)
+        self._evaluate()
+        return bool(self._next_url)
 
     def next(self):
-        return self.__class__(self.API, self.next_url)
+        self._evaluate()
+        return self.__class__(self.API, self._next_url)
 
     def has_previous(self):
-        return bool(self.previous_url)
+        self._evaluate()
+        return bool(self._previous_url)
 
     def previous(self):
-        return self.__class__(self.API, self.previous_url)
+        self._evaluate()
+        return self.__class__(self.API, self._previous_url)
 
     def all_pages(self):
         if self.data:
@@ -140,24 +264,29 @@ class Collection(abc.MutableSequence):
             yield page
 
     def all(self):
-        for page in self.all_pages():
-            for item in page:
+        page = self
+        while True:
+            for item in page._iter_data():
                 yield item
+            if not page.has_next():
+                break
+            page = page.next()
 
     # Filters etc
     def filter(self, **filters):
-        from .resources import Resource
+        global _Resource
+        if _Resource is None:
+            from .resources import Resource as _Resource
 
         params = dict(self._params)
 
         for key, value in filters.items():
-            key = "filter" + "".join(("[{}]".format(part) for part in key.split("__")))
-            if isinstance(value, Resource):
+            if isinstance(value, _Resource):
                 value = value.id
 
-            params[key] = value
+            params[_filter_key(key)] = value
 
-        return self.__class__(self.API, self._url, params)
+        return self._clone(params)
 
     def page(self, *args, **kwargs):
         params = dict(self._params)
@@ -166,19 +295,19 @@ class Collection(abc.MutableSequence):
             params["page"] = args[0]
         elif len(args) == 0 and kwargs:
             for key, value in kwargs.items():
-                params["page[{}]".format(key)] = value
+                params[_page_key(key)] = value
         else:
             raise ValueError(
                 "Either one positional or keyword arguments " "accepted for pagination"
             )
 
-        return self.__class__(self.API, self._url, params)
+        return self._clone(params)
 
     def _param_method(param_name):
         def _method(self, *fields):
-            params = dict(self._params)
-            params[param_name] = ",".join((str(field) for field in fields))
-            return self.__class__(self.API, self._url, params)
+            return self._clone(
+                {**self._params, param_name: ",".join((str(field) for field in fields))}
+            )
 
         return _method
 
@@ -188,9 +317,18 @@ class Collection(abc.MutableSequence):
     fields = _param_method("fields")
 
     def extra(self, **kwargs):
-        params = dict(self._params)
-        params.update(kwargs)
-        return self.__class__(self.API, self._url, params)
+        return self._clone({**self._params, **kwargs})
+
+    def _clone(self, params):
+        """Return a new collection for the same URL with `params` as its query
+        parameters. `params` must be a dict that was freshly built by the
+        caller, so it can be used by the new collection without copying it
+        again.
+        """
+
+        result = self.__class__(self.API, self._url)
+        result._params = params
+        return result
 
     def get(self, **filters):
         if filters:
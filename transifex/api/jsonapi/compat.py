@@ -1,6 +1,8 @@
 from __future__ import absolute_import, unicode_literals
 
+import collections.abc as abc  # noqa
 import json
+from urllib.parse import parse_qs, urlencode, urlparse  # noqa
 
 # `requests` is somewhat inconsistent with how it raises this exception.
 # (https://github.com/psf/requests/issues/5794)
@@ -8,34 +10,30 @@ import json
 # Depending on the environment, the following can happen during
 # `response.json`:
 #
-#   - Python2 and no `simplejson`, a `ValueError` will be raised
-#   - Python2 and `simplejson`, a `simplejson.JSONDecodeError` will be raised
-#   - Python3 and no `simplejson`, a `json.JSONDecodeError` will be raised
-#   - Python3 and `simplejson`, a `simplejson.JSONDecodeError` will be raised
+#   - Without `simplejson`, a `json.JSONDecodeError` will be raised
+#   - With `simplejson`, a `simplejson.JSONDecodeError` will be raised
 #
 # The following wil make sure that catching
 # `transifex.api.jsonapi.compat.JSONDecodeError` in a `try: response.json()`
 # block will always work
-JSONDecodeError = []
-try:
-    JSONDecodeError.append(json.JSONDecodeError)
-except AttributeError:
-    pass
 try:
     import simplejson
-
-    JSONDecodeError.append(simplejson.JSONDecodeError)
 except ImportError:
-    pass
-if not JSONDecodeError:
-    JSONDecodeError = [ValueError]
-JSONDecodeError = tuple(JSONDecodeError)
+    JSONDecodeError = (json.JSONDecodeError,)
+else:
+    JSONDecodeError = (json.JSONDecodeError, simplejson.JSONDecodeError)
 
+# `orjson` is an optional requirement (the `orjson` extra) that parses
+# responses considerably faster than `json`. `orjson.JSONDecodeError` is a
+# subclass of `json.JSONDecodeError`, so the above still covers it
 try:
-    import collections.abc as abc
-except ImportError:
-    import collections as abc  # noqa
-try:
-    from urllib.parse import parse_qs, urlparse
+    import orjson
 except ImportError:
-    from urlparse import parse_qs, urlparse  # noqa
+
+    def response_json(response):
+        return response.json()
+
+else:
+
+    def response_json(response):
+        return orjson.loads(response.content)
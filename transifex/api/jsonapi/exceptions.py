@@ -1,6 +1,18 @@
 from __future__ import absolute_import, unicode_literals
 
 
+def _normalize_codes(errors):
+    """Return the lowercased (status, code) string pairs of {json:api}
+    errors, used to match errors against the codes users look for. Both
+    members are optional, missing ones are returned as empty strings.
+    """
+
+    return [
+        (str(error.get("status", "")).lower(), str(error.get("code", "")).lower())
+        for error in errors
+    ]
+
+
 class JsonApiException(Exception):
     """Assuming a JSON-API error response generated with:
 
@@ -30,6 +42,7 @@ class JsonApiException(Exception):
 
     def __init__(self, status_code, errors, response):
         super().__init__(status_code, errors, response)
+        self._codes = _normalize_codes(errors)
 
     status_code = property(lambda self: self.args[0])
     errors = property(lambda self: self.args[1])
@@ -50,18 +63,19 @@ class JsonApiException(Exception):
         ...     )
         """
 
-        codes = set()
-        for error in errors:
-            codes |= {str(error["status"]).lower(), str(error["code"]).lower()}
-        codes = tuple(sorted(codes))
+        codes = frozenset(
+            (code for pair in _normalize_codes(errors) for code in pair if code)
+        )
 
-        if codes not in cls.EXCEPTION_CLASSES:
+        try:
+            exception_class = cls.EXCEPTION_CLASSES[codes]
+        except KeyError:
             # `type` creates the subclass
             # https://docs.python.org/3/library/functions.html#type
-            cls.EXCEPTION_CLASSES[codes] = type(
-                f"JsonApiException_{'_'.join(codes)}", (cls,), {}
+            exception_class = cls.EXCEPTION_CLASSES[codes] = type(
+                f"JsonApiException_{'_'.join(sorted(codes))}", (cls,), {}
             )
-        return cls.EXCEPTION_CLASSES[codes](status_code, errors, response)
+        return exception_class(status_code, errors, response)
 
     class _NeverRaisedException(Exception):
         pass
@@ -91,7 +105,11 @@ class JsonApiException(Exception):
 
         codes = {str(code).lower() for code in codes}
         return tuple(
-            (value for key, value in cls.EXCEPTION_CLASSES.items() if set(key) & codes)
+            (
+                value
+                for key, value in cls.EXCEPTION_CLASSES.items()
+                if not codes.isdisjoint(key)
+            )
         )
 
     def filter(self, *codes):
@@ -126,12 +144,16 @@ class JsonApiException(Exception):
         ...     )
         """
 
+        if not self.errors:
+            return []
         codes = {str(code).lower() for code in codes}
+        if len(self.errors) == 1:
+            ((status, code),) = self._codes
+            return list(self.errors) if status in codes or code in codes else []
         return [
             error
-            for error in self.errors
-            if str(error["status"]).lower() in codes
-            or str(error["code"]).lower() in codes
+            for error, (status, code) in zip(self.errors, self._codes)
+            if status in codes or code in codes
         ]
 
     def exclude(self, *codes):
@@ -152,12 +174,18 @@ class JsonApiException(Exception):
         ...     )
         """
 
+        if not self.errors:
+            return []
         codes = {str(code).lower() for code in codes}
+        if len(self.errors) == 1:
+            ((status, code),) = self._codes
+            return (
+                list(self.errors) if status not in codes and code not in codes else []
+            )
         return [
             error
-            for error in self.errors
-            if str(error["status"]).lower() not in codes
-            and str(error["code"]).lower() not in codes
+            for error, (status, code) in zip(self.errors, self._codes)
+            if status not in codes and code not in codes
         ]
 
 
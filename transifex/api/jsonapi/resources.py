@@ -5,7 +5,11 @@ from copy import deepcopy
 import requests
 
 from .collections import Collection
+from .exceptions import JsonApiException
 from .utils import (
+    RELATED_KINDS,
+    Kind,
+    classify,
     has_data,
     has_links,
     is_collection,
@@ -13,10 +17,177 @@ from .utils import (
     is_fetched,
     is_list,
     is_null,
-    is_related,
-    is_related_list,
-    is_resource,
-    is_resource_identifier,
+)
+
+
+def _compact(entry):
+    """Drop the empty fields of a bulk operation payload entry."""
+
+    return {key: value for key, value in entry.items() if value}
+
+
+class _TrackedDict(dict):
+    """A dict that records the keys that are set or deleted on it into
+    `changed`, so that `save` can send only what changed. Used for the
+    `relationships` of resources fetched from the server.
+    """
+
+    __slots__ = ("changed",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.changed = _NO_CHANGES
+
+    def _mark(self, *keys):
+        self.changed = self.changed.union(keys)
+
+    def __setitem__(self, key, value):
+        self._mark(key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._mark(key)
+        super().__delitem__(key)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self._mark(key)
+        return super().setdefault(key, default)
+
+    def pop(self, key, *args):
+        if key in self:
+            self._mark(key)
+        return super().pop(key, *args)
+
+    def popitem(self):
+        key, value = super().popitem()
+        self._mark(key)
+        return key, value
+
+    def update(self, *args, **kwargs):
+        other = dict(*args, **kwargs)
+        self._mark(*other)
+        super().update(other)
+
+    def clear(self):
+        self._mark(*self)
+        super().clear()
+
+
+class _WatchedDict(_TrackedDict):
+    """A `_TrackedDict` that also notices changes made in place to its nested
+    values (eg `foo.tags.append(...)`). Used for `attributes`. Copying every
+    value up front would be expensive, so a dict or list value is only copied
+    the first time it is read, to compare with later.
+    """
+
+    __slots__ = ("watched",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.watched = None
+
+    def changed_keys(self):
+        if not self.watched:
+            return self.changed
+        get, missing = dict.get, object()
+        return self.changed.union(
+            key
+            for key, value in self.watched.items()
+            if get(self, key, missing) != value
+        )
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if type(value) in _CONTAINER_TYPES and key not in self.changed:
+            if self.watched is None:
+                self.watched = {}
+            if key not in self.watched:
+                self.watched[key] = _fast_deepcopy(value)
+        return value
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        return super().setdefault(key, default)
+
+
+# Shared by all tracked dicts that have no changes
+_NO_CHANGES = frozenset()
+
+_ATOMIC_TYPES = (type(None), bool, int, float, str)
+_CONTAINER_TYPES = (dict, list)
+
+
+def _fast_deepcopy(value):
+    """`deepcopy` specialized for JSON-like data. Plain dicts, lists and
+    scalars, which is what API payloads are made of, are copied directly;
+    anything else falls back to `deepcopy`.
+    """
+
+    cls = type(value)
+    if cls in _ATOMIC_TYPES:
+        return value
+    elif cls is dict or cls is _TrackedDict or cls is _WatchedDict:
+        return {key: _fast_deepcopy(item) for key, item in value.items()}
+    elif cls is list:
+        return [_fast_deepcopy(item) for item in value]
+    else:
+        return deepcopy(value)
+
+
+def _copy_relationship(value):
+    """Copy a relationship. Its 'data' (a resource identifier) and 'links'
+    are normally flat dicts, so they are copied with `dict.copy` and only
+    non-scalar values inside them are copied recursively.
+    """
+
+    result = {}
+    for key, item in value.items():
+        if type(item) is dict:
+            item = item.copy()
+            for item_key, item_value in item.items():
+                if type(item_value) not in _ATOMIC_TYPES:
+                    item[item_key] = _fast_deepcopy(item_value)
+            result[key] = item
+        else:
+            result[key] = _fast_deepcopy(item)
+    return result
+
+
+# Names that `Resource.__getattr__`/`Resource.__setattr__` never look up in or
+# write to the resource's attributes and relationships
+_RESERVED_GET = frozenset(
+    (
+        "a",
+        "attributes",
+        "R",
+        "relationships",
+        "r",
+        "related",
+        "id",
+        "links",
+        "redirect",
+        "API",
+        "_rid",
+    )
+)
+_RESERVED_SET = frozenset(
+    (
+        "id",
+        "attributes",
+        "relationships",
+        "related",
+        "links",
+        "redirect",
+        "API",
+        "_rid",
+    )
 )
 
 
@@ -30,9 +201,34 @@ class Resource(object):
     EDITABLE values can either be names of attributes or relationships.
     """
 
+    # `__dict__` is kept so that arbitrary attributes can still be set on
+    # instances (and subclasses without `__slots__` don't change the layout),
+    # but the standard fields live in slots
+    __slots__ = (
+        "id",
+        "attributes",
+        "relationships",
+        "related",
+        "links",
+        "redirect",
+        "_rid",
+        "__dict__",
+        "__weakref__",
+    )
+
     TYPE = None
     EDITABLE = None
 
+    # Derived from `TYPE` and `EDITABLE` once per subclass, by
+    # `__init_subclass__`
+    _COLLECTION_URL = None
+    _EDITABLE_SET = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._COLLECTION_URL = "/{}".format(cls.TYPE)
+        cls._EDITABLE_SET = frozenset(cls.EDITABLE or ())
+
     # Creation
     def __init__(self, data=None, **kwargs):
         """Initialize an API resource instance when you know the type."""
@@ -69,8 +265,11 @@ class Resource(object):
         redirect=None,
         # Ignored
         type=None,
+        # Whether 'attributes' and 'links' may be referenced by the caller
+        # afterwards and need to be copied
+        _copy=True,
         # Magic
-        **kwargs
+        **kwargs,
     ):
         """Write to the basic attributes of Resource. Used by '__init__',
         'reload', '__copy__' and 'save'
@@ -82,7 +281,7 @@ class Resource(object):
         if relationships is None:
             relationships = {}
         for key, value in kwargs.items():
-            if is_related(value) or is_related_list(value):
+            if classify(value) in RELATED_KINDS:
                 relationships[key] = value
             else:
                 attributes[key] = value
@@ -90,29 +289,53 @@ class Resource(object):
         # Copy from response
         self.id = id
 
-        self.attributes = deepcopy(attributes)
+        if _copy:
+            attributes = _fast_deepcopy(attributes)
+        self.attributes = attributes
 
-        if links is not None:
-            self.links = deepcopy(links)
+        if links:
+            self.links = _fast_deepcopy(links) if _copy else links
         else:
             self.links = {}
 
         self.redirect = redirect
 
         # Relationships
-        self.relationships, self.related = {}, {}
+        self.relationships = {}
+        self.related = {}
+        # The shape of each relationship, only needed while overwriting
+        kinds = {}
         for key, value in relationships.items():
-            self._set_relationship(key, value)
-            relationship = self.relationships[key]
-            if is_null(relationship) or has_data(relationship):
+            kinds[key] = self._set_relationship(key, value)
+            if kinds[key] != "links":
                 self.set_related(key, value)
 
-        if included is not None:
-            included = {(item["type"], item["id"]): item for item in included}
-            for relationship_name, relationship in self.relationships.items():
-                if is_null(relationship) or not has_data(relationship):
-                    continue
-                if is_list(relationship["data"]):  # Plural with data
+        if included:
+            # Only index the included resources that are actually referenced
+            needed = set()
+            for key, kind in kinds.items():
+                if kind == "plural":
+                    needed.update(
+                        (r["type"], r["id"]) for r in self.relationships[key]["data"]
+                    )
+                elif kind == "singular":
+                    data = self.relationships[key]["data"]
+                    needed.add((data["type"], data["id"]))
+            if needed:
+                included = {
+                    key: item
+                    for key, item in (
+                        ((item["type"], item["id"]), item) for item in included
+                    )
+                    if key in needed
+                }
+            else:
+                included = None
+
+        if included:
+            for relationship_name, kind in kinds.items():
+                relationship = self.relationships[relationship_name]
+                if kind == "plural":
                     new_items = [
                         included.get(
                             (r["type"], r["id"]), self.related[relationship_name][i]
@@ -120,11 +343,37 @@ class Resource(object):
                         for i, r in enumerate(relationship["data"])
                     ]
                     self.set_related(relationship_name, new_items)
-                else:  # Singular
+                elif kind == "singular":
                     key = (relationship["data"]["type"], relationship["data"]["id"])
                     if key in included:
                         self.set_related(relationship_name, included[key])
 
+        if not _copy:
+            # Data from the server, see `_mark_saved`
+            self._mark_saved()
+
+    def _mark_saved(self):
+        """Consider the current attributes and relationships to be what the
+        server has and track changes to them from now on, so that `save` can
+        send only those. Not done for resources built from data supplied by
+        the caller (or by collections, where it would cost memory for every
+        item), which send all their fields.
+        """
+
+        self.attributes = _WatchedDict(self.attributes)
+        self.relationships = _TrackedDict(self.relationships)
+
+    def _changed_fields(self):
+        """Return the names of the attributes and of the relationships that
+        were changed since the resource was fetched or last saved, or None if
+        changes are not tracked.
+        """
+
+        attributes, relationships = self.attributes, self.relationships
+        if type(attributes) is _WatchedDict and type(relationships) is _TrackedDict:
+            return attributes.changed_keys(), relationships.changed
+        return None
+
     def _set_relationship(self, key, value):
         """Set 'value' as 'key' relationship. For value we accept:
 
@@ -137,10 +386,12 @@ class Resource(object):
         - None
 
         Regardless, in the end `self.relationships` will resemble an API
-        response's relationships.
+        response's relationships. Returns the shape of the new relationship:
+        "null", "singular", "plural" or "links" (when it has no 'data').
         """
 
-        if is_related_list(value):
+        kind = classify(value)
+        if kind is Kind.RELATED_LIST:
             if has_data(value):
                 data = value["data"]
             else:
@@ -152,18 +403,28 @@ class Resource(object):
             }
             if has_links(value):
                 self.relationships[key]["links"] = value["links"]
-        elif is_resource(value):
+            return "plural"
+        elif kind is Kind.RESOURCE:
             self.relationships[key] = value.as_relationship()
+            return "singular"
+        elif kind is Kind.RESOURCE_IDENTIFIER:
+            self.relationships[key] = {"data": _fast_deepcopy(value)}
+            return "singular"
+        elif kind is Kind.NULL:
+            self.relationships[key] = None
+            return "null"
+        elif kind is not Kind.OTHER:
+            self.relationships[key] = _copy_relationship(value)
+            if kind is Kind.LINKS:
+                return "links"
+            data = value["data"]
+            if data is None:
+                return "null"
+            return "plural" if is_list(data) else "singular"
         else:
-            value = deepcopy(value)
-            if not is_null(value) and is_resource_identifier(value):
-                value = {"data": value}
-            if is_null(value) or has_data(value) or has_links(value):
-                self.relationships[key] = value
-            else:
-                raise ValueError(
-                    "Invalid type '{}' for relationship '{}'".format(value, key)
-                )
+            raise ValueError(
+                "Invalid type '{}' for relationship '{}'".format(value, key)
+            )
 
     def set_related(self, key, value):
         """Set 'value' as 'key' relationship's value. Works only with singular
@@ -195,12 +456,13 @@ class Resource(object):
             # Plural
             if has_data(value):
                 value = value["data"]
-            self.related[key] = Collection.from_data(self.API, {"data": []})
+            as_resource = self.API.as_resource
+            resources, new_relationship = [], []
             for item in value:
-                self.related[key].append(self.API.as_resource(item))
-            new_relationship = [
-                item.as_resource_identifier() for item in self.related[key]
-            ]
+                item = as_resource(item)
+                resources.append(item)
+                new_relationship.append(item.as_resource_identifier())
+            self.related[key] = Collection.from_resources(self.API, resources)
             if new_relationship != relationship["data"]:
                 relationship["data"] = new_relationship
         else:
@@ -211,7 +473,7 @@ class Resource(object):
             data_changed = (
                 not is_null(relationship)
                 and not is_null(value)
-                and (relationship["data"] != value.as_resource_identifier())
+                and (relationship["data"] != value._resource_identifier())
             )
             if null_to_not_null or not_null_to_null or data_changed:
                 if value is None:
@@ -248,37 +510,24 @@ class Resource(object):
 
     # Shortcuts
     def __getattr__(self, attr):
-        if attr in (
-            "a",
-            "attributes",
-            "R",
-            "relationships",
-            "r",
-            "related",
-            "id",
-            "links",
-            "redirect",
-            "API",
-        ):
-            return super(Resource, self).__getattribute__(attr)
-        elif attr in self.attributes:
-            return self.attributes[attr]
-        elif attr in self.related:
-            return self.related[attr]
-        else:
+        # Dunder probes (`__iter__`, `__len__` etc) never refer to attributes
+        # or relationships
+        if attr in _RESERVED_GET or attr.startswith("__"):
             return super(Resource, self).__getattribute__(attr)
+        attributes = self.attributes
+        if attr in attributes:
+            return attributes[attr]
+        related = self.related
+        if attr in related:
+            return related[attr]
+        return super(Resource, self).__getattribute__(attr)
 
     def __setattr__(self, attr, value):
-        if attr in (
-            "id",
-            "attributes",
-            "relationships",
-            "related",
-            "links",
-            "redirect",
-            "API",
-        ):
+        if attr in _RESERVED_SET or attr.startswith("__"):
             super(Resource, self).__setattr__(attr, value)
+            if attr == "id":
+                # Invalidate the cached resource identifier
+                super(Resource, self).__setattr__("_rid", None)
         elif attr in self.attributes:
             self.attributes[attr] = value
         elif attr in self.relationships:
@@ -296,7 +545,7 @@ class Resource(object):
         params = None
         if include is not None:
             params = {"include": ",".join(include)}
-        url = self.links.get("self", self.get_item_url())
+        url = self.get_item_url()
         response_body = self.API.request("get", url, params=params)
         if (
             isinstance(response_body, requests.Response)
@@ -304,10 +553,17 @@ class Resource(object):
         ):
             self._overwrite(id=self.id, redirect=response_body.headers["Location"])
         else:
-            self._overwrite(
-                included=response_body.get("included"), **response_body["data"]
+            self._overwrite_from_response(
+                response_body["data"], included=response_body.get("included")
             )
 
+    def _overwrite_from_response(self, data, included=None):
+        """Like `_overwrite`, for data parsed from a response body that
+        nothing else references, so there is no need to copy it.
+        """
+
+        self._overwrite(included=included, _copy=False, **data)
+
     @classmethod
     def get(cls, id=None, include=None, **filters):
         """Get a resource object by its ID."""
@@ -363,30 +619,66 @@ class Resource(object):
                     )
                 )
 
+        singular, plural = [], []
         for relationship_name in relationship_names:
             relationship = self.relationships[relationship_name]
 
             if is_null(relationship):
                 continue
 
-            related = self.related.get(relationship_name)
-            is_singular_fetched = is_fetched(related)
-            is_plural_fetched = is_collection(related) and all(
-                (is_fetched(item) for item in related)
-            )
-            if (is_singular_fetched or is_plural_fetched) and not force:
-                # Has been fetched already
-                continue
+            if not force:
+                related = self.related.get(relationship_name)
+                if is_fetched(related) or (
+                    is_collection(related)
+                    and all((is_fetched(item) for item in related))
+                ):
+                    # Has been fetched already
+                    continue
 
             if has_data(relationship) and not is_list(relationship["data"]):
-                # Singular relationship
-                self.related[relationship_name].reload()
+                singular.append(relationship_name)
             else:
-                # Plural relationship
-                url = relationship.get("links", {}).get(
-                    "related", "/{}/{}/{}".format(self.TYPE, self.id, relationship_name)
+                plural.append(relationship_name)
+
+        if len(singular) > 1 and self.id is not None:
+            # Try to fetch all singular relationships with one request instead
+            # of one per relationship. Only the included resources are used,
+            # so that unsaved changes to 'self' are kept
+            try:
+                response_body = self.API.request(
+                    "get",
+                    self.get_item_url(),
+                    params={"include": ",".join(singular)},
                 )
-                self.related[relationship_name] = Collection(self.API, url)
+            except (JsonApiException, requests.HTTPError):
+                # The server doesn't support including (some of) these
+                response_body = None
+            if response_body is not None and not isinstance(
+                response_body, requests.Response
+            ):
+                included = {
+                    (item["type"], item["id"]): item
+                    for item in response_body.get("included") or ()
+                }
+                remaining = []
+                for relationship_name in singular:
+                    data = self.relationships[relationship_name]["data"]
+                    item = included.get((data["type"], data["id"]))
+                    if item is None:
+                        remaining.append(relationship_name)
+                    else:
+                        self.related[relationship_name]._overwrite_from_response(item)
+                singular = remaining
+
+        for relationship_name in singular:
+            self.related[relationship_name].reload()
+
+        for relationship_name in plural:
+            relationship = self.relationships[relationship_name]
+            url = relationship.get("links", {}).get("related")
+            if url is None:
+                url = f"{self._COLLECTION_URL}/{self.id}/{relationship_name}"
+            self.related[relationship_name] = Collection(self.API, url)
 
         if len(relationship_names) == 1:
             # This way you can do `project.fetch('languages').filter(...)`
@@ -394,12 +686,17 @@ class Resource(object):
 
     @classmethod
     def list(cls):
-        return Collection(cls.API, "/{}".format(cls.TYPE))
+        return Collection(cls.API, cls._COLLECTION_URL)
 
     def _collection_method(method):
+        # Resolved once here instead of with `getattr` on every call
+        function = getattr(Collection, method)
+
         def _method(cls, *args, **kwargs):
-            return getattr(cls.list(), method)(*args, **kwargs)
+            return function(cls.list(), *args, **kwargs)
 
+        _method.__name__ = method
+        _method.__doc__ = function.__doc__
         return classmethod(_method)
 
     filter = _collection_method("filter")
@@ -444,8 +741,12 @@ class Resource(object):
             self._save_new(*fields)
 
     def _save_existing(self, *fields):
+        data = self._generate_data_for_saving(*fields)
+        if data is None:
+            # Nothing changed since the resource was fetched or last saved
+            return
         payload = self.as_resource_identifier()
-        payload.update(self._generate_data_for_saving(*fields))
+        payload.update(data)
         response_body = self.API.request(
             "patch", self.get_item_url(), json={"data": payload}
         )
@@ -462,9 +763,30 @@ class Resource(object):
         self._post_save(response_body)
 
     def _generate_data_for_saving(self, *fields):
+        """Return the 'attributes' and 'relationships' to send when saving.
+        For existing resources with no `fields` and no `EDITABLE`, this is
+        what changed since the resource was fetched or last saved, or None if
+        nothing did.
+        """
+
         result = {}
         editable_fields = fields or self.EDITABLE
-        if editable_fields is not None:
+        changed = None
+        if editable_fields is None and self.id is not None:
+            changed = self._changed_fields()
+        if changed is not None:
+            attributes, relationships = changed
+            if not attributes and not relationships:
+                return None
+            # Deleted fields are sent as null
+            get = dict.get
+            for field in attributes:
+                result.setdefault("attributes", {})[field] = get(self.attributes, field)
+            for field in relationships:
+                result.setdefault("relationships", {})[field] = get(
+                    self.relationships, field, {"data": None}
+                )
+        elif editable_fields is not None:
             for field in editable_fields:
                 if field in self.attributes:
                     result.setdefault("attributes", {})[field] = self.attributes[field]
@@ -487,6 +809,7 @@ class Resource(object):
         ) and response_body.status_code in (202, 204):
             # Success, but the server did not return any new data so our object
             # is considered sufficiently populated with data
+            self._mark_saved()
             return
 
         data = response_body["data"]
@@ -516,10 +839,9 @@ class Resource(object):
 
         relationships = data.pop("relationships", {})
         relationships.update(related)
+        data["relationships"] = relationships
 
-        self._overwrite(
-            relationships=relationships, included=response_body.get("included"), **data
-        )
+        self._overwrite_from_response(data, included=response_body.get("included"))
 
     @classmethod
     def create(cls, *args, **kwargs):
@@ -593,8 +915,9 @@ class Resource(object):
         """
 
         value = self.API.as_resource(value)
-        self._edit_relationship("patch", field, value.as_resource_identifier())
-        self.relationships[field]["data"] = value.as_resource_identifier()
+        resource_identifier = value.as_resource_identifier()
+        self._edit_relationship("patch", field, resource_identifier)
+        self.relationships[field]["data"] = resource_identifier
         if self.related[field] != value:
             self.related[field] = value
 
@@ -679,17 +1002,14 @@ class Resource(object):
         self._edit_plural_relationship("patch", field, values)
 
     def _edit_relationship(self, method, field, value):
-        url = (
-            self.relationships[field]
-            .get("links", {})
-            .get("self", "/{}/{}/relationships/{}".format(self.TYPE, self.id, field))
-        )
+        url = self.relationships[field].get("links", {}).get("self")
+        if url is None:
+            url = f"{self._COLLECTION_URL}/{self.id}/relationships/{field}"
         self.API.request(method, url, json={"data": value})
 
     def _edit_plural_relationship(self, method, field, values):
-        payload = [
-            self.API.as_resource(item).as_resource_identifier() for item in values
-        ]
+        as_resource = self.API.as_resource
+        payload = [as_resource(item)._resource_identifier() for item in values]
         self._edit_relationship(method, field, payload)
 
     # Bulk actions
@@ -716,13 +1036,8 @@ class Resource(object):
             >>> Foo.bulk_delete(foos)
         """
 
-        payload = []
-
-        for item in items:
-            item = cls.as_resource(item)
-            if not is_resource(item):
-                item = cls(id=item)
-            payload.append(item.as_resource_identifier())
+        bulk_delete_entry = cls._bulk_delete_entry
+        payload = [bulk_delete_entry(item) for item in items]
 
         cls.API.request(
             "delete", cls.get_collection_url(), json={"data": payload}, bulk=True
@@ -762,24 +1077,8 @@ class Resource(object):
             ...                             ...])
         """
 
-        payload = []
-        for item in items:
-            if is_list(item):
-                attributes, relationships = item
-                item = cls(attributes=attributes, relationships=relationships)
-            else:
-                item = cls.as_resource(item)
-                if not isinstance(item, Resource):
-                    item = cls(attributes=item)
-
-            payload.append({"type": cls.TYPE})
-            if item.attributes:
-                payload[-1]["attributes"] = item.attributes
-            if item.relationships:
-                payload[-1]["relationships"] = item.relationships
-            if item.id:
-                payload[-1]["id"] = item.id
-
+        bulk_create_entry = cls._bulk_create_entry
+        payload = [bulk_create_entry(item) for item in items]
         response_body = cls.API.request(
             "post", cls.get_collection_url(), json={"data": payload}, bulk=True
         )
@@ -810,57 +1109,101 @@ class Resource(object):
         """
 
         if fields is None:
-            fields = cls.EDITABLE
-
-        payload = []
-        for item in items:
-
-            if is_list(item):
-                try:
-                    id, attributes, relationships = item
-                except ValueError:
-                    id, attributes = item
-                    relationships = None
-                item = cls(id=id, attributes=attributes, relationships=relationships)
-            else:
-                item = cls.as_resource(item)
-                if not isinstance(item, Resource):
-                    item = cls(id=item)
-
-            if item.id is None:
-                raise ValueError("'id' not supplied as part of an update " "operation")
-
-            attributes, relationships = item.attributes, item.relationships
-            if fields:
-                if attributes is not None:
-                    attributes = {
-                        key: value for key, value in attributes.items() if key in fields
-                    }
-                if relationships is not None:
-                    relationships = {
-                        key: value
-                        for key, value in relationships.items()
-                        if key in fields
-                    }
-
-            payload.append(item.as_resource_identifier())
-            if attributes:
-                payload[-1]["attributes"] = attributes
-            if relationships:
-                payload[-1]["relationships"] = {
-                    key: cls.API.as_resource(value).as_relationship()
-                    for key, value in relationships.items()
-                }
+            fields = cls._EDITABLE_SET
+        else:
+            fields = frozenset(fields)
 
+        bulk_update_entry = cls._bulk_update_entry
+        payload = [bulk_update_entry(item, fields) for item in items]
         response_body = cls.API.request(
             "patch", cls.get_collection_url(), json={"data": payload}, bulk=True
         )
         return Collection.from_data(cls.API, response_body)
 
+    @classmethod
+    def _bulk_delete_entry(cls, item):
+        """Convert an item accepted by `bulk_delete` to a payload entry."""
+
+        if isinstance(item, Resource):
+            return item._resource_identifier()
+        if is_dict(item):
+            item = cls.as_resource(item)
+            if isinstance(item, Resource):
+                return item._resource_identifier()
+        # A plain ID; no need to build a Resource just for its identifier
+        return {"type": cls.TYPE, "id": item}
+
+    @classmethod
+    def _bulk_create_entry(cls, item):
+        """Convert an item accepted by `bulk_create` to a payload entry."""
+
+        if is_list(item):
+            attributes, relationships = item
+            item = cls(attributes=attributes, relationships=relationships)
+        else:
+            item = cls.as_resource(item)
+            if not isinstance(item, Resource):
+                item = cls(attributes=item)
+
+        return _compact(
+            {
+                "type": cls.TYPE,
+                "attributes": item.attributes,
+                "relationships": item.relationships,
+                "id": item.id,
+            }
+        )
+
+    @classmethod
+    def _bulk_update_entry(cls, item, fields):
+        """Convert an item accepted by `bulk_update` to a payload entry."""
+
+        if is_list(item):
+            try:
+                id, attributes, relationships = item
+            except ValueError:
+                id, attributes = item
+                relationships = None
+            item = cls(id=id, attributes=attributes, relationships=relationships)
+        else:
+            item = cls.as_resource(item)
+            if not isinstance(item, Resource):
+                item = cls(id=item)
+
+        if item.id is None:
+            raise ValueError("'id' not supplied as part of an update " "operation")
+
+        attributes, relationships = item.attributes, item.relationships
+        if fields:
+            attributes = {
+                key: value for key, value in attributes.items() if key in fields
+            }
+            relationships = {
+                key: value for key, value in relationships.items() if key in fields
+            }
+
+        as_resource = cls.API.as_resource
+        entry = item.as_resource_identifier()
+        entry.update(
+            _compact(
+                {
+                    "attributes": attributes,
+                    "relationships": {
+                        key: as_resource(value).as_relationship()
+                        for key, value in relationships.items()
+                    },
+                }
+            )
+        )
+        return entry
+
     # Utils
     def __eq__(self, other):
-        other = self.API.as_resource(other)
-        return self.as_resource_identifier() == other.as_resource_identifier()
+        if type(other) is type(self):
+            return self.id == other.id
+        if not isinstance(other, Resource):
+            other = self.API.as_resource(other)
+        return self.TYPE == other.TYPE and self.id == other.id
 
     def __repr__(self):
         if self.__class__ is Resource:
@@ -869,7 +1212,7 @@ class Resource(object):
             class_name = self.__class__.__name__
 
         if self.id is not None:
-            details = self.id
+            details = f"{self.id}"
         else:
             details = "Unsaved"
 
@@ -879,11 +1222,12 @@ class Resource(object):
         if not self.attributes and not self.relationships:
             details += " (Unfetched)"
 
-        return repr("<{}: {}>".format(class_name, details))
+        return f"<{class_name}: {details}>"
 
     def __copy__(self):
-        # Will eventually call `_overwrite` so `deepcopy` will be used
-        relationships = deepcopy(self.relationships)
+        # `_overwrite` copies every relationship it is given, so a shallow
+        # copy is enough here
+        relationships = dict(self.relationships)
         relationships.update(self.related)
         return self.__class__(
             id=self.id,
@@ -893,18 +1237,27 @@ class Resource(object):
             redirect=self.redirect,
         )
 
+    def _resource_identifier(self):
+        """Cached version of `as_resource_identifier`, for internal use where
+        the result is only compared or serialized and never mutated.
+        """
+
+        if self._rid is None:
+            self._rid = {"type": self.TYPE, "id": self.id}
+        return self._rid
+
     def as_resource_identifier(self):
-        return {"type": self.TYPE, "id": self.id}
+        return dict(self._resource_identifier())
 
     def as_relationship(self):
         return {"data": self.as_resource_identifier()}
 
     @classmethod
     def get_collection_url(cls):
-        return "/{}".format(cls.TYPE)
+        return cls._COLLECTION_URL
 
     def get_item_url(self):
-        if "self" in self.links:
-            return self.links["self"]
-        else:
-            return "/{}/{}".format(self.TYPE, self.id)
+        url = self.links.get("self")
+        if url is None:
+            url = f"{self._COLLECTION_URL}/{self.id}"
+        return url
@@ -1,6 +1,6 @@
 from __future__ import absolute_import, unicode_literals
 
-import six
+from enum import IntEnum
 
 from .compat import abc
 
@@ -17,12 +17,16 @@ def is_collection(value):
     return isinstance(value, Collection)
 
 
+# The `dict`/`list`/`tuple` checks go first because they are much cheaper than
+# the ABC ones and cover what JSON payloads are made of
 def is_dict(value):
-    return isinstance(value, abc.Mapping)
+    return isinstance(value, dict) or isinstance(value, abc.Mapping)
 
 
 def is_list(value):
-    return isinstance(value, abc.Sequence) and not isinstance(value, six.string_types)
+    return isinstance(value, (list, tuple)) or (
+        isinstance(value, abc.Sequence) and not isinstance(value, str)
+    )
 
 
 def is_null(value):
@@ -38,16 +42,14 @@ def has_links(value):
 
 
 def is_resource_identifier(value):
-    return is_dict(value) and {"type", "id"} <= set(value.keys())
+    return is_dict(value) and "type" in value and "id" in value
 
 
 def is_relationship(value):
-    return (
-        is_dict(value)
-        and has_data("value")
-        and is_dict(value["data"])
-        and is_resource_identifier(value["data"])
-    )
+    if not is_dict(value):
+        return False
+    data = value.get("data")
+    return is_dict(data) and "type" in data and "id" in data
 
 
 def is_related(value):
@@ -60,8 +62,58 @@ def is_related_list(value):
     if has_data(value):
         value = value["data"]
 
-    return is_list(value) and all((is_related(item) for item in value))
+    if not is_list(value):
+        return False
+    for item in value:
+        if not is_related(item):
+            return False
+    return True
 
 
 def is_fetched(value):
     return is_resource(value) and (value.attributes or value.relationships)
+
+
+class Kind(IntEnum):
+    """What a relationship value is, as determined by `classify`."""
+
+    NULL = 0
+    RESOURCE = 1
+    RESOURCE_IDENTIFIER = 2
+    RELATIONSHIP = 3  # A dict with a resource identifier as 'data'
+    RELATED_LIST = 4  # A list of related values, maybe wrapped in 'data'
+    DATA = 5  # Any other dict with 'data'
+    LINKS = 6  # A dict with 'links' but no 'data'
+    OTHER = 7
+
+
+# The kinds for which `is_related(value) or is_related_list(value)` holds
+RELATED_KINDS = frozenset(
+    (Kind.RESOURCE, Kind.RESOURCE_IDENTIFIER, Kind.RELATIONSHIP, Kind.RELATED_LIST)
+)
+
+
+def classify(value):
+    """Classify a relationship value in one pass, instead of running the
+    `is_*`/`has_*` predicates over it one after the other.
+    """
+
+    if value is None:
+        return Kind.NULL
+    if is_resource(value):
+        return Kind.RESOURCE
+    if is_dict(value):
+        if is_resource_identifier(value):
+            return Kind.RESOURCE_IDENTIFIER
+        if "data" in value:
+            if is_related_list(value):
+                return Kind.RELATED_LIST
+            if is_relationship(value):
+                return Kind.RELATIONSHIP
+            return Kind.DATA
+        if "links" in value:
+            return Kind.LINKS
+        return Kind.OTHER
+    if is_related_list(value):
+        return Kind.RELATED_LIST
+    return Kind.OTHER
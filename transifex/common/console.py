@@ -1,5 +1,7 @@
 from __future__ import unicode_literals
 
+import re
+
 import click
 from transifex.native.rendering import StringRenderer
 
@@ -18,23 +20,9 @@ class Color:
     @staticmethod
     def format(string):
         """Format the given string, adding color support."""
-        return (
-            # Context
-            string.replace('[high]', Color.WHITE_BOLD)
-            .replace('[warn]', Color.PINK)
-            .replace('[file]', Color.CYAN)
-            .replace('[opt]', Color.PINK)
-            .replace('[prompt]', Color.YELLOW)
-            .replace('[error]', Color.RED)
-            .replace('[end]', Color.END)  # closing tag for any color tag
-
-            # Colors
-            .replace('[pink]', Color.PINK)
-            .replace('[cyan]', Color.CYAN)
-            .replace('[green]', Color.GREEN)
-            .replace('[red]', Color.RED)
-            .replace('[yel]', Color.YELLOW)
-        )
+        if '[' not in string:
+            return string
+        return _TAG_RUN_RE.sub(_replace_tag_run, string)
 
     @staticmethod
     def echo(string, new_line=True):
@@ -45,6 +33,47 @@ class Color:
             print(Color.format(string)),
 
 
+_TAGS = {
+    # Context
+    'high': Color.WHITE_BOLD,
+    'warn': Color.PINK,
+    'file': Color.CYAN,
+    'opt': Color.PINK,
+    'prompt': Color.YELLOW,
+    'error': Color.RED,
+    'end': Color.END,  # closing tag for any color tag
+
+    # Colors
+    'pink': Color.PINK,
+    'cyan': Color.CYAN,
+    'green': Color.GREEN,
+    'red': Color.RED,
+    'yel': Color.YELLOW,
+}
+_TAG_NAMES = '|'.join(map(re.escape, _TAGS))
+_TAG_RE = re.compile(r'\[({})\]'.format(_TAG_NAMES))
+# Runs of adjacent tags, eg `[high][cyan]`. Starting the pattern with a
+# literal '[' (rather than a repeated group) lets `re` jump straight to
+# the next '[' instead of trying the pattern at every position
+_TAG_RUN_RE = re.compile(r'\[({0})\](?:\[(?:{0})\])*'.format(_TAG_NAMES))
+
+
+def _replace_tag_run(match):
+    """Replace a run of adjacent tags with a single escape sequence that
+    combines their codes, eg `[high][cyan]` => `\\033[1;36m`. Repeated
+    codes, like in `[end][end]`, are emitted once.
+    """
+    run, first_tag = match.group(0, 1)
+    if len(run) == len(first_tag) + 2:  # A single tag
+        return _TAGS[first_tag]
+    codes = []
+    for tag in _TAG_RE.findall(run):
+        code = _TAGS[tag][2:-1]  # '\033[36m' => '36'
+        if not codes or codes[-1] != code:
+            codes.append(code)
+    return '\033[{}m'.format(';'.join(codes))
+
+
 def prompt(prompt_msg, description=None, default=None, new_line=False, vtype=None):
     """Prompt the user to enter a reply.
 
@@ -75,9 +104,7 @@ def pluralized(one, other, cnt_value):
     :return: a rendered string that has taken into account the given
     :rtype: unicode
     """
-    icu_string = '{cnt, plural, one {[one]} other {[other]}}'\
-        .replace('[one]', one)\
-        .replace('[other]', other)
+    icu_string = '{cnt, plural, one {' + one + '} other {' + other + '}}'
 
     return StringRenderer.render(
         icu_string,
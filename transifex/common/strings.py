@@ -1,16 +1,14 @@
 from __future__ import unicode_literals
 
-# A single quote that is not preceded by \
-# i.e. matches "This is 'something" but not "This is \' something"
 import re
 from functools import wraps
+from itertools import count
 
 VAR_FORMAT = "variable_{cnt}"
 
-RE_SINGLE_QUOTE = r"(?<!\\)\'"
-# A double quote that is not preceded by \
-# i.e. matches 'This is "something' but not 'This is \" something'
-RE_DOUBLE_QUOTE = r"(?<!\\)\""
+# Placeholders converted by `printf_to_format_style`: '%(foo)s', where group 1
+# is the name, or '%s'
+_RE_PLACEHOLDER = re.compile(r"%\((\w+)\)s|%s")
 
 
 def printf_to_format_style(string):
@@ -29,46 +27,54 @@ def printf_to_format_style(string):
         and a list of the names of all variables
     :rtype: tuple
     """
-    obj = {"cnt": 1, "variables": []}  # Python 2 nonlocal workaround
+    # Every placeholder contains one of these substrings; `in` is a lot
+    # cheaper than running the regular expression
+    if "%s" not in string and "%(" not in string:
+        return string, []
 
-    def replace_named(match):
-        """Given a regex match like '%(foo)s' return '{foo}'.
+    variables = []
+    counter = count(1)
 
-        Also stores the found variable inside `obj`.
+    def replace(match):
+        """Given a regex match like '%(foo)s' return '{foo}' and given '%s'
+        return '{variable_N}', where N is an auto-increase integer.
+
+        Also stores the found variable inside `variables`.
 
         :param match: a regex match object
         :return: a new string using str.format() placeholder syntax
         :rtype: str
         """
-        # [2:-2] means from '%(foo)s' -> get 'foo'
-        var = match.group(0)[2:-2]
-        new = "{{{}}}".format(var)
-        obj["variables"].append(var)
-        return new
+        var = match.group(1)
+        if var is None:
+            var = VAR_FORMAT.format(cnt=next(counter))
+        variables.append(var)
+        return "{" + var + "}"
 
-    pattern = re.compile(r"(%\(\w+\)s)")
-    new_string, total = re.subn(pattern, replace_named, string)
+    new_string = _RE_PLACEHOLDER.sub(replace, string)
 
-    def replace_unnamed(match):
-        """Given a regex match like '%s' return '{variable_N}' where N
-        is an auto-increase integer.
+    return new_string, variables
 
-        Also stores the found variable inside `obj`.
 
-        :param match: a regex match object
-        :return: a new string using str.format() placeholder syntax
-        :rtype: str
-        """
-        var = VAR_FORMAT.format(cnt=str(obj["cnt"]))
-        new = "{{{}}}".format(var)
-        obj["variables"].append(var)
-        obj["cnt"] += 1
-        return new
+def batch_printf_to_format_style(strings):
+    """Apply `printf_to_format_style` to many strings at once.
 
-    pattern = re.compile("(%s)")
-    new_string, total = re.subn(pattern, replace_unnamed, new_string)
+    Strings without any '%' character, usually the vast majority, are
+    returned as they are without a function call.
 
-    return new_string, obj["variables"]
+    Usage:
+    >>> batch_printf_to_format_style(['Hello', 'This is %s'])
+    <<< [('Hello', []), ('This is {variable_1}', ['variable_1'])]
+
+    :param list strings: the source strings
+    :return: a list with a (new string, variables) tuple for each string,
+        in the same order
+    :rtype: list
+    """
+    return [
+        printf_to_format_style(string) if "%" in string else (string, [])
+        for string in strings
+    ]
 
 
 def alt_quote(quote, string):
@@ -93,63 +99,49 @@ def alt_quote(quote, string):
     :rtype: unicode
     """
     alternate = '"' if quote == "'" else "'"
-    pattern = RE_SINGLE_QUOTE if quote == "'" else RE_DOUBLE_QUOTE
-    pattern_alt = RE_SINGLE_QUOTE if quote == '"' else RE_DOUBLE_QUOTE
-    if re.search(pattern, string) and not re.search(pattern_alt, string):
+    if _has_unescaped(quote, string) and not _has_unescaped(alternate, string):
         return alternate
     return quote
 
 
-def lazy_str_meta(name, bases, dct):
-    """Metaclass for lazy strings. We modify all functions of `str` except the
-    "dangerous" ones to versions that operate on `str(self)`. `str(self)` is what
-    performs the lazy evaluation of the string (see below).
+def _has_unescaped(char, string):
+    """Return True if `char` appears in `string` without a \\ before it,
+    i.e. '"' matches 'This is "something' but not 'This is \\" something'.
     """
+    index = string.find(char)
+    while index >= 0:
+        if index == 0 or string[index - 1] != "\\":
+            return True
+        index = string.find(char, index + 1)
+    return False
+
+
+def _evaluated(name):
+    """Return a version of the `str` method `name` that operates on `str(self)`.
+    `str(self)` is what performs the lazy evaluation of the string (see below).
+    """
+
+    func = getattr(str, name)
+
+    @wraps(func)
+    def method(self, *args, **kwargs):
+        return func(str(self), *args, **kwargs)
+
+    return method
+
+
+# The public methods of `str`, which `LazyString` overrides after its definition
+_STR_METHODS = sorted((name for name in dir(str) if not name.startswith("_")))
+
 
-    for attr in set(dir(str)) - {
-        "__repr__",
-        "__sizeof__",
-        "__init__",
-        "__doc__",
-        "__reduce__",
-        "__new__",
-        "__str__",
-        "__dir__",
-        "__getnewargs__",
-        "__getattribute__",
-        "__subclasshook__",
-        "__delattr__",
-        "__setattr__",
-        "__reduce_ex__",
-        "__init_subclass__",
-        "__class__",
-    }:
-        func = getattr(str, attr)
-        if not callable(func):
-            continue
-
-        # We have to do this "double-wrapping" of the function because otherwise all
-        # functions assigned to `dct` will have the same, last function we defined
-        def a(func):
-            @wraps(func)
-            def b(self, *args, **kwargs):
-                return func(str(self), *args, **kwargs)
-
-            return b
-
-        dct[attr] = a(func)
-
-    return type(name, bases, dct)
-
-
-class LazyString(str, metaclass=lazy_str_meta):
+class LazyString(str):
     """Lazy string implementation.
 
     We use __new__ to save an empty string or the fallback value and also the '_func',
     '_args' and '_kwargs' attributes. The empty string or fallback value is not supposed
     to be used anywhere. Instead, all methods that would be inherited from `str` have
-    been replaced by the metaclass with ones that operate on `str(self)`, which runs the
-    lazy evaluation. We also manually override '__radd__'.
+    been replaced with ones that operate on `str(self)`, which runs the lazy
+    evaluation. We also manually override '__radd__'.
 
         Usage:
 
@@ -174,6 +166,26 @@ class LazyString(str, metaclass=lazy_str_meta):
     string and to use as a return value for `__repr__`.
     """
 
+    __slots__ = ("_fallback_value", "_func", "_args", "_kwargs")
+
+    __add__ = _evaluated("__add__")
+    __contains__ = _evaluated("__contains__")
+    __eq__ = _evaluated("__eq__")
+    __format__ = _evaluated("__format__")
+    __ge__ = _evaluated("__ge__")
+    __getitem__ = _evaluated("__getitem__")
+    __gt__ = _evaluated("__gt__")
+    __hash__ = _evaluated("__hash__")
+    __iter__ = _evaluated("__iter__")
+    __le__ = _evaluated("__le__")
+    __len__ = _evaluated("__len__")
+    __lt__ = _evaluated("__lt__")
+    __mod__ = _evaluated("__mod__")
+    __mul__ = _evaluated("__mul__")
+    __ne__ = _evaluated("__ne__")
+    __rmod__ = _evaluated("__rmod__")
+    __rmul__ = _evaluated("__rmul__")
+
     def __new__(cls, func, *args, fallback_value="", **kwargs):
         self = super().__new__(cls, fallback_value)
         self._fallback_value = fallback_value
@@ -211,3 +223,45 @@ class LazyString(str, metaclass=lazy_str_meta):
         """
 
         return left + str(right)
+
+
+for _name in _STR_METHODS:
+    setattr(LazyString, _name, _evaluated(_name))
+del _name
+
+
+_MISSING = object()
+
+
+class CachedLazyString(LazyString):
+    """A `LazyString` that is evaluated once, the first time it is needed, and
+    reuses the result afterwards. Use it for strings that don't depend on state
+    that changes, eg the active language. If that state does change, call
+    `invalidate()` to have the string evaluated again.
+    """
+
+    __slots__ = ("_cached", "_hash")
+
+    def __new__(cls, func, *args, fallback_value="", **kwargs):
+        self = super().__new__(
+            cls, func, *args, fallback_value=fallback_value, **kwargs
+        )
+        self._cached = _MISSING
+        self._hash = None
+        return self
+
+    def __str__(self):
+        if self._cached is _MISSING:
+            self._cached = super().__str__()
+        return self._cached
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(str(self))
+        return self._hash
+
+    def invalidate(self):
+        """Forget the cached result, so that it is evaluated again."""
+
+        self._cached = _MISSING
+        self._hash = None
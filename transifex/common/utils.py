@@ -1,8 +1,17 @@
 import importlib
 import re
-from datetime import datetime
+from functools import lru_cache, partial
 from hashlib import md5
 
+# The key hash is not used for security, which lets it work on FIPS-enabled
+# systems where plain md5() is blocked. `usedforsecurity` needs Python 3.9+
+try:
+    md5(usedforsecurity=False)
+except TypeError:  # pragma: no cover
+    _key_hash = md5
+else:
+    _key_hash = partial(md5, usedforsecurity=False)
+
 
 def generate_key(string=None, context=None):
     """Return a unique key based on the given source string and context.
@@ -20,11 +29,17 @@ def generate_key(string=None, context=None):
         if isinstance(context, list):
             context = u','.join(context)
 
-        return ('::'.join([string, context]))
+        return string + '::' + context
 
     return string
 
 
+def _escape_plural(plural):
+    """ Escape the : character (and the \\ character that will be
+    used for escaping)"""
+    return plural.replace('\\', '\\\\').replace(':', '\\:')
+
+
 def generate_hashed_key(string=None, context=None):
     """Return a unique key based on the given source string and context.
 
@@ -35,22 +50,16 @@ def generate_hashed_key(string=None, context=None):
     :rtype: str
     """
 
-    def escape_plural(plural):
-        """ Escape the : character (and the \ character that will be
-        used for escaping)"""
-        return plural.replace('\\', '\\\\').replace(':', '\:')
-
     if not string:
         raise ValueError("You need to specify at least a `string`")
 
     _, plurals = parse_plurals(string)
 
-    string_content = u':'.join(
-        u'{}:{}'.format(rule, escape_plural(string))
-        for rule, string in sorted(
-            plurals.items(), key=lambda x: x[0]
-        )
-    )
+    # Rules are unique, so sorting the items sorts by rule
+    string_content = u':'.join([
+        u'{}:{}'.format(rule, _escape_plural(plural))
+        for rule, plural in sorted(plurals.items())
+    ])
 
     if context:  # pragma: no cover
         if isinstance(context, list):
@@ -59,13 +68,15 @@ def generate_hashed_key(string=None, context=None):
             context = u':'.join(context.split(','))
     if not context:  # pragma: no cover
         context = ''
-    return md5(
-        (':'.join([string_content, context])).encode('utf-8')
+    return _key_hash(
+        (string_content + ':' + context).encode('utf-8')
     ).hexdigest()
 
 
+@lru_cache(maxsize=None)
 def import_to_python(import_str):
-    """Given a string 'a.b.c' return object c from a.b module.
+    """Given a string 'a.b.c' return object c from a.b module. The result is
+    cached per path.
 
     :param str import_str: a path like a.b.c.
     """
@@ -84,13 +95,20 @@ def make_hashable(data):
     :return: a hashable object
     :rtype: object
     """
-    if isinstance(data, (list, tuple)):
-        return tuple((make_hashable(item) for item in sorted(data)))
-    elif isinstance(data, dict):
-        return tuple(
+    if isinstance(data, dict):
+        return tuple([
             (key, make_hashable(value))
             for key, value in sorted(data.items())
-        )
+        ])
+    elif isinstance(data, (list, tuple)):
+        # Sort after converting, so that lists of dicts/lists can be sorted
+        items = [make_hashable(item) for item in data]
+        try:
+            items.sort()
+        except TypeError:
+            # Items of different types that can't be compared
+            items.sort(key=repr)
+        return tuple(items)
     else:
         return data
 
@@ -114,115 +132,102 @@ def parse_plurals(string):
         :rtype: tuple(bool, dict) (Whether the string was parsed & the resulted plurals)
     """
 
+    # The string is scanned with indexes and only the plurals themselves are
+    # sliced out of it
     plurals = {}
     try:
         # {cnt, plural, one {foo} other {foos}}
         # ^^^^^^^^^^^^
-        variable_name, remaining = _consume_preamble(string)
-        # {cnt, plural, one {foo} other {foos}}
-        #               ^^^^^^^^^
-        rule, remaining = _consume_rule(remaining)
-        plural, remaining = _consume_plural(remaining.strip())
-        plurals[rule] = plural
-        while remaining.strip():
+        end = len(string) - 1  # The closing bracket
+        if string[0] != '{' or string[end] != '}':
+            raise ValueError()
+        first_comma_pos = string.index(',')
+        second_comma_pos = string.index(',', first_comma_pos + 1)
+        keyword = string[first_comma_pos + 1:second_comma_pos].strip()
+        if (keyword != "plural" or
+                not _RE_WORD_CHAR.search(string, 1, first_comma_pos)):
+            raise ValueError()
+
+        pos = _skip_space(string, second_comma_pos + 1, end)
+        while pos < end:
+            # {cnt, plural, one {foo} other {foos}}
+            #               ^^^     ^^^^^
+            left_bracket_pos = string.index('{', pos, end)
+            rule = string[pos:left_bracket_pos].strip()
+            if rule[0] == "=":
+                rule_num = int(rule[1:])
+                if not 0 <= rule_num <= 5:
+                    raise ValueError()
+            else:
+                rule_num = _RULE_NUMS[rule]
             # {cnt, plural, one {foo} other {foos}}
-            #                         ^^^^^^^^^^^^
-            rule, remaining = _consume_rule(remaining.strip())
-            plural, remaining = _consume_plural(remaining.strip())
-            plurals[rule] = plural
+            #                   ^^^^^       ^^^^^^
+            right_bracket_pos = _find_plural_end(string, left_bracket_pos, end)
+            plurals[rule_num] = string[left_bracket_pos + 1:right_bracket_pos]
+            pos = _skip_space(string, right_bracket_pos + 1, end)
     except Exception:
         return (False, {5: string})
 
-    if ((len(plurals) == 1 and 5 not in plurals) or
-            bool({1, 5} - set(plurals.keys()))):
+    # Both the 'one' and the 'other' rules are required
+    if 1 not in plurals or 5 not in plurals:
         return (False, {5: string})
 
     return (True, plurals)
 
 
-# The `_consume_FOO` functions take an input, "consume" a part of it to produce
-# the first return value and return the "unconsumed" part of the input as the
-# second return value
-def _consume_preamble(string):
-    """ Usage:
-
-            >>> _consume_preamble('{cnt, plural, one {ONE} other {OTHER}}')
-            <<< ('cnt', 'one {ONE} other {OTHER}')
-    """
-
-    if string[0] != '{' or string[-1] != '}':
-        raise ValueError()
-    first_comma_pos = string.index(',')
-    second_comma_pos = string.index(',', first_comma_pos + 1)
-    variable_name = string[1:first_comma_pos].strip()
-    keyword = string[first_comma_pos + 1:second_comma_pos].strip()
-    if not re.search(r'[\w_]+', variable_name) or keyword != "plural":
-        raise ValueError()
-    return variable_name, string[second_comma_pos + 1:-1].strip()
+_RE_WORD_CHAR = re.compile(r'\w')
+_RE_NON_SPACE = re.compile(r'\S')
+_RE_PLURAL_SPECIAL_CHAR = re.compile("['{}]")
+_RULE_NUMS = {'zero': 0, 'one': 1, 'two': 2, 'few': 3, 'many': 4, 'other': 5}
 
 
-def _consume_rule(string):
-    """ Usage:
-
-            >>> _consume_rule('one {ONE} other {OTHER}')
-            <<< ('one', '{ONE} other {OTHER}')
-            >>> _consume_rule('other {OTHER}')
-            <<< ('other', '{OTHER}')
+def _skip_space(string, pos, end):
+    """ Return the position of the first non-whitespace character of
+        `string[pos:end]`, or `end` if there is none.
     """
 
-    def _get_rule_num(rule):
-        return {
-            'zero': 0, 'one': 1, 'two': 2,
-            'few': 3, 'many': 4, 'other': 5
-        }[rule]
-
-    left_bracket_pos = string.index('{')
-    rule = string[:left_bracket_pos].strip()
-    if rule[0] == "=":
-        rule = rule[1:]
-        rule = int(rule)
-        rule = {0: "zero",
-                1: "one", 2: "two", 3: "few", 4: "many", 5: "other"}[rule]
-    else:
-        if rule not in ('zero', 'one', 'two', 'few', 'many', 'other'):
-            raise ValueError()
-
-    return _get_rule_num(rule), string[left_bracket_pos:].strip()
+    match = _RE_NON_SPACE.search(string, pos, end)
+    return end if match is None else match.start()
 
 
-def _consume_plural(string):
-    """ Usage:
+def _find_plural_end(string, pos, end):
+    """ Given the position of the opening bracket of a plural, return the
+        position of its closing bracket, taking nested brackets and ICU
+        quoting into account. Only `string[pos:end]` is examined.
 
-            >>> _consume_plural('{ONE} other {OTHER}')
-            <<< ('ONE', 'other {OTHER}')
-            >>> _consume_plural('{OTHER}')
-            <<< ('OTHER', '')
+            >>> _find_plural_end('{ONE} other {OTHER}', 0, 19)
+            <<< 4
     """
 
+    # Fast path: no nested brackets or quotes before the first '}'
+    right_bracket_pos = string.find('}', pos, end)
+    if (right_bracket_pos != -1 and
+            string.find('{', pos + 1, right_bracket_pos) == -1 and
+            string.find("'", pos, right_bracket_pos) == -1):
+        return right_bracket_pos
+
     bracket_count, escaping = 0, False
-    ptr = 0
-    while ptr < len(string):
-        char = string[ptr]
+    skip = None  # Position of the second quote of a `''` pair
+    # Only quotes and brackets matter, so jump from one to the next
+    for match in _RE_PLURAL_SPECIAL_CHAR.finditer(string, pos, end):
+        ptr = match.start()
+        if ptr == skip:
+            continue
+        char = match.group()
         if char == "'":
-            try:
-                peek = string[ptr+1]
-            except IndexError:  # pragma: no cover
-                peek = None
+            peek = string[ptr + 1] if ptr + 1 < end else ''
             if peek == "'":
-                ptr += 1
-            else:
-                if escaping:
-                    escaping = False
-                else:
-                    if peek in ('{', '}'):
-                        escaping = True
+                skip = ptr + 1
+            elif escaping:
+                escaping = False
+            elif peek in ('{', '}'):
+                escaping = True
         elif char == '{':
             if not escaping:
                 bracket_count += 1
-        elif char == '}':
+        else:
             if not escaping:
                 bracket_count -= 1
             if bracket_count == 0:
-                return string[1:ptr], string[ptr + 1:].strip()
-        ptr += 1
+                return ptr
     raise ValueError()
@@ -1,9 +1,11 @@
 import logging
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
 from transifex.native.consts import (KEY_CHARACTER_LIMIT,
                                      KEY_DEVELOPER_COMMENT, KEY_OCCURRENCES,
                                      KEY_TAGS)
@@ -36,6 +38,9 @@ MAPPING = {
 MAX_RETRIES = 3
 RETRY_DELAY_SEC = 2
 
+# Maximum number of languages whose translations are fetched in parallel
+MAX_FETCH_WORKERS = 8
+
 
 class EtagStore(object):
     """ Manges etags """
@@ -73,6 +78,15 @@ class CDSHandler(object):
         self.secret = secret
         self.host = host or TRANSIFEX_CDS_HOST
         self.etags = EtagStore()
+        # Reuse connections (keep-alive) across requests to the CDS. The
+        # session is shared by the fetch workers and the daemon thread: this
+        # is safe because none of them change its state (headers etc are
+        # passed per request), and the connection pools are thread-safe and
+        # sized so that every worker can keep its own connection
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=MAX_FETCH_WORKERS)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
 
     def fetch_languages(self):
         """Fetch the languages defined in the CDS for the specific project.
@@ -140,8 +154,6 @@ class CDSHandler(object):
         if query_params:
             cds_url = cds_url + '?' + urlencode(query_params)
 
-        translations = {}
-
         if not language_code:
             languages = [lang['code'] for lang in self.fetch_languages()]
         else:
@@ -154,53 +166,72 @@ class CDSHandler(object):
         if not self.fetch_all_langs:
             languages &= set(self.configured_language_codes)
 
-        for language_code in languages:
+        if len(languages) > 1:
+            # Requests are network-bound, so fetch the languages in parallel
+            with ThreadPoolExecutor(
+                    max_workers=min(len(languages), MAX_FETCH_WORKERS)
+            ) as executor:
+                languages = list(languages)
+                results = executor.map(
+                    lambda code: self._fetch_language(code, cds_url),
+                    languages,
+                )
+                translations = dict(zip(languages, results))
+        else:
+            translations = {
+                code: self._fetch_language(code, cds_url)
+                for code in languages
+            }
+
+        return translations
+
+    def _fetch_language(self, language_code, cds_url):
+        """Fetch the translations of a single language.
 
-            try:
-                response = self.retry_get_request(
-                    (self.host + cds_url.format(language_code=language_code)),
-                    headers=self._get_headers(
-                        etag=self.etags.get(language_code)
-                    )
+        :param str language_code: the language to fetch
+        :param str cds_url: the CDS URL template, with filters applied
+        :return: a (refresh_flag, translations) tuple
+        :rtype: tuple
+        """
+        try:
+            response = self.retry_get_request(
+                (self.host + cds_url.format(language_code=language_code)),
+                headers=self._get_headers(
+                    etag=self.etags.get(language_code)
                 )
+            )
 
-                if not response.ok:
-                    logger.error(
-                        'Error retrieving translations from CDS: `{}`'.format(
-                            response.reason
-                        )
-                    )
-                    response.raise_for_status()
-
-                # etags indicate that no translation have been updated
-                if response.status_code == 304:
-                    translations[language_code] = (False, {})
-                else:
-                    self.etags.set(
-                        language_code, response.headers.get('ETag', ''))
-                    json_content = response.json()
-                    translations[language_code] = (
-                        True, json_content['data']
+            if not response.ok:
+                logger.error(
+                    'Error retrieving translations from CDS: `{}`'.format(
+                        response.reason
                     )
+                )
+                response.raise_for_status()
 
-            except (KeyError, ValueError):
-                # Compatibility with python2.7 where `JSONDecodeError` doesn't
-                # exist
-                logger.error('Error retrieving translations from CDS: '
-                             'Malformed response')  # pragma no cover
-                translations[language_code] = (False, {})  # pragma no cover
-            except requests.ConnectionError:
-                logger.error(
-                    'Error retrieving translations from CDS: ConnectionError')
-                translations[language_code] = (False, {})
-            except Exception as e:
-                logger.error(
-                    'Error retrieving translations from CDS: UnknownError '
-                    '(`{}`)'.format(str(e))
-                )  # pragma no cover
-                translations[language_code] = (False, {})
+            # etags indicate that no translation have been updated
+            if response.status_code == 304:
+                return (False, {})
+            self.etags.set(language_code, response.headers.get('ETag', ''))
+            json_content = response.json()
+            return (True, json_content['data'])
 
-        return translations
+        except (KeyError, ValueError):
+            # Compatibility with python2.7 where `JSONDecodeError` doesn't
+            # exist
+            logger.error('Error retrieving translations from CDS: '
+                         'Malformed response')  # pragma no cover
+            return (False, {})  # pragma no cover
+        except requests.ConnectionError:
+            logger.error(
+                'Error retrieving translations from CDS: ConnectionError')
+            return (False, {})
+        except Exception as e:
+            logger.error(
+                'Error retrieving translations from CDS: UnknownError '
+                '(`{}`)'.format(str(e))
+            )  # pragma no cover
+            return (False, {})
 
     def push_source_strings(self, strings, purge=False,
                             do_not_keep_translations=False,
@@ -232,7 +263,7 @@ class CDSHandler(object):
         response = None
 
         try:
-            response = requests.post(
+            response = self._session.post(
                 self.host + cds_url,
                 headers=self._get_headers(use_secret=True),
                 json={
@@ -269,7 +300,7 @@ class CDSHandler(object):
 
         response = None
         try:
-            response = requests.get(
+            response = self._session.get(
                 self.host + job_path,
                 headers=self._get_headers(use_secret=True),
             )
@@ -302,7 +333,7 @@ class CDSHandler(object):
 
         response = None
         try:
-            response = requests.post(
+            response = self._session.post(
                 self.host + cds_url,
                 headers=self._get_headers(use_secret=True),
                 json={}
@@ -373,7 +404,7 @@ class CDSHandler(object):
                 retries += 1
                 time.sleep(retries * RETRY_DELAY_SEC)
 
-            response = requests.get(*args, **kwargs)
+            response = self._session.get(*args, **kwargs)
             last_response_status = response.status_code
 
         return response
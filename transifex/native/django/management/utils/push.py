@@ -107,6 +107,18 @@ class Push(CommandMixin):
         self.do_not_keep_translations = options['do_not_keep_translations']
         self.no_wait = options['no_wait']
         self.key_generator = options['key_generator']
+        # The key generator and file encoding are the same for all files,
+        # so resolve them once instead of for every file we extract from
+        self.fkeygen = generate_key
+        if self.key_generator == 'hash':
+            self.fkeygen = generate_hashed_key
+        self.encoding = (
+            settings.FILE_CHARSET if (
+                self.settings_available
+                and hasattr(settings, 'FILE_CHARSET')
+            )
+            else 'utf-8'
+        )
         extensions = options['extensions']
         if self.domain == 'djangojs':
             exts = extensions if extensions else ['js']
@@ -234,20 +246,11 @@ class Push(CommandMixin):
         :return: a list of SourceString objects
         :rtype: list
         """
-        fkeygen = generate_key
-        if self.key_generator == 'hash':
-            fkeygen = generate_hashed_key
+        fkeygen, encoding = self.fkeygen, self.encoding
 
         self.verbose('Processing file %s in %s' % (
             translatable_file.file, translatable_file.dirpath
         ))
-        encoding = (
-            settings.FILE_CHARSET if (
-                hasattr(settings, 'FILE_CHARSET')
-                and self.settings_available
-            )
-            else 'utf-8'
-        )
         try:
             src_data = self._read_file(translatable_file.path, encoding)
         except UnicodeDecodeError as e:
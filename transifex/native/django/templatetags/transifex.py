@@ -11,7 +11,6 @@ from django.template.defaulttags import token_kwargs
 from django.utils.html import escape as escape_html
 from django.utils.safestring import SafeData, mark_safe
 from django.utils.translation import get_language, to_locale
-from transifex.common._compat import string_types
 from transifex.native import tx
 from transifex.native.django.compat import (TOKEN_BLOCK, TOKEN_COMMENT,
                                             TOKEN_TEXT, TOKEN_VAR)
@@ -179,7 +178,7 @@ class TNode(Node):
         self.asvar = asvar
 
     def render(self, context):
-        if isinstance(self.source_string.var, string_types):
+        if isinstance(self.source_string.var, str):
             # Tag had a string literal or used block syntax
             source_icu_template = self.source_string.var
         else:
@@ -234,7 +233,7 @@ class TNode(Node):
             # django's escape marking, we perform the escaping manually, if
             # needed.
             should_escape = (
-                isinstance(value, string_types) and
+                isinstance(value, str) and
                 ((context.autoescape and not isinstance(value, SafeData)) or
                  (not context.autoescape and isinstance(value, EscapeData)))
             )
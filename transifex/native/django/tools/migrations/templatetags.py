@@ -11,7 +11,6 @@ from django.template.base import DebugLexer, Parser
 from django.template.defaulttags import token_kwargs
 from django.templatetags.i18n import do_block_translate, do_translate
 from django.utils.html import escape as escape_html
-from transifex.common._compat import string_types, text_type
 from transifex.native.django.compat import (TOKEN_BLOCK, TOKEN_COMMENT,
                                             TOKEN_TEXT, TOKEN_VAR)
 from transifex.native.django.utils import templates
@@ -43,7 +42,7 @@ def _render_params(params):
     result = []
     for key, value in sorted(params.items(), key=lambda i: i[0]):
         if value and value != COMMENT_FOUND:
-            result.append('='.join((key, text_type(value))))
+            result.append('='.join((key, str(value))))
     return ' '.join(result)
 
 
@@ -476,11 +475,11 @@ class DjangoTagMigrationBuilder(object):
         # attempt changes it in any way.
         # eg `{% trans "a b" %}`            => `{% t "a b" %}`
         #    `{% trans "<xml>a</xml> b" %}` => `{% ut "<xml>a</xml> b" %}`
-        if isinstance(trans_node.filter_expression.var, string_types):
+        if isinstance(trans_node.filter_expression.var, str):
             literal = trans_node.filter_expression.var
         else:
             literal = trans_node.filter_expression.var.literal
-        if (isinstance(literal, string_types) and
+        if (isinstance(literal, str) and
                 escape_html(literal) != literal):
             tag_name = "ut"
         else:
@@ -1,10 +1,12 @@
 from __future__ import unicode_literals
 
+import re
+from functools import lru_cache
+
 from django import VERSION as DJANGO_VERSION
 from django.template.base import Lexer, Parser
-from transifex.common._compat import string_types
 from transifex.common.utils import generate_key
-from transifex.native.consts import KEY_CONTEXT
+from transifex.native.consts import ALL_KEYS, KEY_CONTEXT
 from transifex.native.django.compat import TOKEN_BLOCK
 from transifex.native.django.templatetags.transifex import do_t
 from transifex.native.parsing import SourceString
@@ -28,6 +30,14 @@ TRANSIFEX_TAG_NAME = 'transifex'
 COMMENT_FOUND = object()
 COPY_AS_IS = object()
 
+# Matches the opening of a {% t %} or {% ut %} tag; used to skip tokenizing
+# and parsing templates that contain no translatable content at all
+T_TAG_START_RE = re.compile(r'{%\s*u?t\b')
+
+# The tag parameters that end up in a SourceString (e.g. `_context`, `_tags`);
+# all other parameters are ICU variables and are ignored during extraction
+META_KEYS = frozenset(ALL_KEYS)
+
 
 # hack to make the identity function
 # signature compatible to all template filters
@@ -58,13 +68,13 @@ def tnode_to_source_string(tnode, fkeygen):
 
         :param func fkeygen: key generator function
     """
-    if not isinstance(tnode.source_string.var, string_types):
+    if not isinstance(tnode.source_string.var, str):
         return None
     meta = {}
     for key, value in tnode.params.items():
-        if len(value.filters) != 0:
+        if key not in META_KEYS or len(value.filters) != 0:
             continue
-        if isinstance(value.var, string_types):
+        if isinstance(value.var, str):
             meta[key] = value.var
         elif getattr(value.var, 'literal', None) is not None:
             meta[key] = value.var.literal
@@ -90,6 +100,52 @@ def extract_transifex_template_strings(
     :rtype: list
     """
     src = force_text(src, charset)
+
+    strings = []
+    for tnode, lineno in _parse_t_tags(src, origin):
+        source_string = tnode_to_source_string(tnode, fkeygen)
+        if source_string is None:
+            continue
+        if lineno and origin:
+            source_string.occurrences = ["{}:{}".format(origin, lineno)]
+
+        strings.append(source_string)
+
+    return strings
+
+
+def _parse_t_tags(src, origin=None):
+    """Parse the given template and return the nodes of its {% t %} and
+    {% ut %} tags.
+
+    The result is cached by source, so that identical templates are only
+    tokenized and parsed once, whichever file they come from; occurrences are
+    added by the caller. The returned nodes are only read, never rendered, so
+    sharing them is safe.
+
+    :param unicode src: the whole Django template
+    :param str origin: an optional context for the filename of the source,
+        used when the template cannot be parsed
+    :return: a tuple of (TNode, line number) tuples
+    :rtype: tuple
+    """
+    try:
+        return _parse_t_tags_cached(src)
+    except Exception:
+        # Failures are not cached; parse again with the origin, so that the
+        # error raised refers to the template
+        return _parse_t_tags_uncached(src, origin)
+
+
+@lru_cache(maxsize=1024)
+def _parse_t_tags_cached(src):
+    return _parse_t_tags_uncached(src)
+
+
+def _parse_t_tags_uncached(src, origin=None):
+    if T_TAG_START_RE.search(src) is None:
+        return ()
+
     tokens = Lexer(src).tokenize()
     parser = Parser(tokens, {}, [], origin)
     # Since no template libraries are loaded when this code is running,
@@ -98,19 +154,11 @@ def extract_transifex_template_strings(
     # Without the override, a KeyError is raised inside the parser.
     parser.find_filter = find_filter_identity
 
-    strings = []
+    tnodes = []
     while parser.tokens:
         token = parser.next_token()
         if (token.token_type == TOKEN_BLOCK and
                 token.split_contents()[0] in ('t', 'ut')):
-            tnode = do_t(parser, token)
-            source_string = tnode_to_source_string(tnode, fkeygen)
-            if source_string is None:
-                continue
-            if token.lineno and origin:
-                source_string.occurrences = [
-                    "{}:{}".format(origin, token.lineno)]
-
-            strings.append(source_string)
+            tnodes.append((do_t(parser, token), token.lineno))
 
-    return strings
+    return tuple(tnodes)
@@ -4,7 +4,6 @@ import ast
 import re
 from collections import namedtuple
 
-from transifex.common._compat import string_types
 from transifex.common.utils import generate_key, make_hashable
 from transifex.native import consts
 from transifex.native.consts import KEY_CONTEXT, KEY_KEY
@@ -101,7 +100,7 @@ class SourceString(object):
         :rtype: dict
         """
         tags = meta.get(consts.KEY_TAGS)
-        if tags and isinstance(tags, string_types):
+        if tags and isinstance(tags, str):
             meta[consts.KEY_TAGS] = [x.strip() for x in tags.split(',')]
 
         return {
@@ -5,7 +5,6 @@ import xml.sax.saxutils as saxutils
 from math import ceil
 
 from pyseeyou import format
-from transifex.common._compat import string_types, text_type
 from transifex.common.utils import import_to_python
 
 logger = logging.getLogger('transifex.rendering')
@@ -20,7 +19,7 @@ def html_escape(item):
         escaping
     :rtype: object
     """
-    if not isinstance(item, string_types):
+    if not isinstance(item, str):
         return item
 
     html_escape_table = {
@@ -175,7 +174,7 @@ class PseudoTranslationPolicy(AbstractRenderingPolicy):
 
         :rtype: unicode
         """
-        return text_type(source_string).translate(PseudoTranslationPolicy.TABLE)
+        return str(source_string).translate(PseudoTranslationPolicy.TABLE)
 
 
 class WrappedStringPolicy(AbstractRenderingPolicy):